@@ -198,6 +198,8 @@ CREATE TABLE audit_log (
 CREATE INDEX idx_jobs_project_id ON jobs(project_id);
 CREATE INDEX idx_jobs_status ON jobs(status);
 CREATE INDEX idx_jobs_embedding ON jobs USING ivfflat (embedding vector_cosine_ops);
+CREATE INDEX idx_jobs_parsed_skills ON jobs USING gin ((parsed_data->'skills'));
+CREATE INDEX idx_jobs_parsed_updated_at ON jobs(updated_at) WHERE parsed_data IS NOT NULL;
 CREATE INDEX idx_resumes_user_id ON resumes(user_id);
 CREATE INDEX idx_resumes_organization_id ON resumes(organization_id);
 CREATE INDEX idx_resume_variants_resume_id ON resume_variants(resume_id);
@@ -8,10 +8,74 @@ import logging
 from typing import List, Dict, Tuple, Set
 from collections import Counter
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
+
 logger = logging.getLogger(__name__)
 
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*')
+
+
+def hash_tokens(text: str) -> np.ndarray:
+    """Tokenize lowercased text into an array of token hashes"""
+    return np.fromiter(
+        (hash(token) for token in TOKEN_PATTERN.findall(text.lower())),
+        dtype=np.int64,
+    )
+
+
+@njit(cache=True, nogil=True)
+def match_token_hashes(token_hashes: np.ndarray, target_hashes: np.ndarray) -> Tuple[int, int]:
+    """Count occurrences of a token-hash sequence and return (frequency, first index)"""
+    n = token_hashes.shape[0]
+    m = target_hashes.shape[0]
+    frequency = 0
+    first_index = -1
+    if m == 0 or m > n:
+        return frequency, first_index
+
+    for i in range(n - m + 1):
+        matched = True
+        for j in range(m):
+            if token_hashes[i + j] != target_hashes[j]:
+                matched = False
+                break
+        if matched:
+            if first_index < 0:
+                first_index = i
+            frequency += 1
+
+    return frequency, first_index
+
+
+def warmup_numba() -> None:
+    """Compile (or load cached) Numba kernels with representative inputs"""
+    token_hashes = np.resize(hash_tokens("python developer aws"), 16)
+    kernels = [
+        (match_token_hashes, (token_hashes, token_hashes[:1])),
+    ]
+
+    # Numba compilation releases the GIL, so kernels compile in parallel
+    with ThreadPoolExecutor(max_workers=len(kernels)) as executor:
+        futures = [executor.submit(kernel, *args) for kernel, args in kernels]
+        for future in futures:
+            future.result()
+
+
 class KeywordExtractor:
     """Extracts keywords and key phrases from job descriptions"""
 
@@ -231,11 +295,10 @@ class KeywordExtractor:
 
     async def calculate_keyword_relevance(self, keyword: str, text: str) -> float:
         """Calculate how relevant a keyword is to the text"""
-        keyword_lower = keyword.lower()
-        text_lower = text.lower()
+        token_hashes = hash_tokens(text)
+        frequency, first_position = match_token_hashes(token_hashes, hash_tokens(keyword))
 
         # Frequency score
-        frequency = text_lower.count(keyword_lower)
         if frequency == 0:
             return 0.0
 
@@ -243,11 +306,10 @@ class KeywordExtractor:
         length_score = min(len(keyword) / 50, 1.0)
 
         # Position score (keywords appearing earlier are more important)
-        first_position = text_lower.find(keyword_lower)
-        position_score = max(0, 1 - (first_position / len(text))) if first_position >= 0 else 0
+        total_words = token_hashes.shape[0]
+        position_score = max(0, 1 - (first_position / total_words))
 
         # Uniqueness score (keywords that appear less frequently are more unique)
-        total_words = len(text.split())
         uniqueness_score = min(frequency / total_words, 1.0)
 
         # Combine scores
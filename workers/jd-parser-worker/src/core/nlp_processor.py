@@ -7,6 +7,7 @@ import re
 import logging
 from typing import List, Dict, Any, Optional
 import asyncio
+from contextlib import contextmanager
 from functools import lru_cache
 
 try:
@@ -23,6 +24,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Components skipped on the per-document hot path; a sentencizer stands in for the parser
+HOT_PATH_DISABLED = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
 class NLPProcessor:
     """Natural Language Processing utilities for job description analysis"""
 
@@ -56,14 +60,15 @@ class NLPProcessor:
 
                 # Load spaCy model
                 try:
-                    self.nlp_model = spacy.load("en_core_web_sm")
+                    self.nlp_model = spacy.load("en_core_web_sm", disable=HOT_PATH_DISABLED)
                 except OSError:
                     logger.warning("spaCy model 'en_core_web_sm' not found. Installing...")
                     import subprocess
                     subprocess.run([
                         "python", "-m", "spacy", "download", "en_core_web_sm"
                     ], check=True)
-                    self.nlp_model = spacy.load("en_core_web_sm")
+                    self.nlp_model = spacy.load("en_core_web_sm", disable=HOT_PATH_DISABLED)
+                self.nlp_model.add_pipe("sentencizer")
 
             self._initialized = True
             logger.info("NLP processor initialized successfully")
@@ -107,12 +112,7 @@ class NLPProcessor:
         try:
             # Process with spaCy
             doc = self.nlp_model(cleaned_text)
-
-            result['sentences'] = [sent.text for sent in doc.sents]
-            result['tokens'] = [token.text for token in doc if not token.is_punct and not token.is_space]
-            result['entities'] = [(ent.text, ent.label_) for ent in doc.ents]
-            result['lemmas'] = [token.lemma_ for token in doc if not token.is_punct and not token.is_space]
-            result['pos_tags'] = [(token.text, token.pos_) for token in doc if not token.is_punct and not token.is_space]
+            self._apply_doc(result, doc)
 
         except Exception as e:
             logger.warning(f"spaCy processing failed, using basic processing: {e}")
@@ -121,6 +121,33 @@ class NLPProcessor:
 
         return result
 
+    def _apply_doc(self, result: Dict[str, Any], doc) -> None:
+        """Fill a processed-text result from a spaCy Doc"""
+        words = [token for token in doc if not token.is_punct and not token.is_space]
+
+        result['sentences'] = [sent.text for sent in doc.sents]
+        result['tokens'] = [token.text for token in words]
+
+        # Only present when the corresponding components ran
+        if doc.has_annotation("ENT_IOB"):
+            result['entities'] = [(ent.text, ent.label_) for ent in doc.ents]
+        if doc.has_annotation("LEMMA"):
+            result['lemmas'] = [token.lemma_ for token in words]
+        if doc.has_annotation("POS"):
+            result['pos_tags'] = [(token.text, token.pos_) for token in words]
+
+    @contextmanager
+    def _pipes_enabled(self, *names: str):
+        """Temporarily enable components disabled for the hot path"""
+        enabled = [name for name in names if name in self.nlp_model.disabled]
+        for name in enabled:
+            self.nlp_model.enable_pipe(name)
+        try:
+            yield
+        finally:
+            for name in enabled:
+                self.nlp_model.disable_pipe(name)
+
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
@@ -133,8 +160,8 @@ class NLPProcessor:
         text = re.sub(r'[^\w\s.,!?-]', '', text)
 
         # Normalize quotes
-        text = re.sub(r'["""]', '"', text)
-        text = re.sub(r'[''']', "'", text)
+        text = re.sub(r'[\u201c\u201d\u201e]', '"', text)
+        text = re.sub(r'[\u2018\u2019\u201a]', "'", text)
 
         # Remove multiple consecutive punctuation
         text = re.sub(r'[.,!?-]{2,}', lambda m: m.group(0)[0], text)
@@ -174,7 +201,8 @@ class NLPProcessor:
             return []
 
         try:
-            doc = self.nlp_model(text)
+            with self._pipes_enabled("tok2vec", "ner"):
+                doc = self.nlp_model(text)
             return [(ent.text, ent.label_) for ent in doc.ents]
         except Exception:
             return []
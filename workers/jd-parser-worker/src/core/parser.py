@@ -5,13 +5,13 @@ Main orchestrator for parsing job descriptions and extracting structured informa
 
 import re
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple
+from dataclasses import dataclass, field
 import asyncio
 
 from .nlp_processor import NLPProcessor
 from .skill_extractor import SkillExtractor
-from .keyword_extractor import KeywordExtractor
+from .keyword_extractor import KeywordExtractor, warmup_numba, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +26,39 @@ class ParsedJobResult:
     salary_range: Optional[Dict[str, Any]] = None
     location: Optional[str] = None
     job_type: Optional[str] = None
-    benefits: List[str] = []
-    responsibilities: List[str] = []
-    qualifications: List[str] = []
-    technologies: List[str] = []
-    soft_skills: List[str] = []
-    industry_keywords: List[str] = []
+    benefits: List[str] = field(default_factory=list)
+    responsibilities: List[str] = field(default_factory=list)
+    qualifications: List[str] = field(default_factory=list)
+    technologies: List[str] = field(default_factory=list)
+    soft_skills: List[str] = field(default_factory=list)
+    industry_keywords: List[str] = field(default_factory=list)
     confidence_scores: Dict[str, float] = None
 
     def __post_init__(self):
         if self.confidence_scores is None:
             self.confidence_scores = {}
 
+# Parser owned by the current ProcessPoolExecutor worker
+_worker_parser: Optional["JobDescriptionParser"] = None
+
+def init_worker_parser():
+    """ProcessPoolExecutor initializer: build the parser and load models once per worker"""
+    global _worker_parser
+
+    _worker_parser = JobDescriptionParser(
+        nlp_processor=NLPProcessor(),
+        skill_extractor=SkillExtractor(),
+        keyword_extractor=KeywordExtractor(),
+    )
+    asyncio.run(_worker_parser.nlp_processor.initialize())
+
+    if NUMBA_AVAILABLE:
+        warmup_numba()
+
+def parse_batch_in_worker(jobs: List[Dict[str, Any]]) -> List["ParsedJobResult"]:
+    """Parse a batch of jobs inside a worker process"""
+    return asyncio.run(_worker_parser.parse_batch(jobs))
+
 class JobDescriptionParser:
     """Main parser for job descriptions using NLP and ML techniques"""
 
@@ -102,6 +123,90 @@ class JobDescriptionParser:
         # Process text with NLP
         processed_text = await self.nlp_processor.process_text(text)
 
+        result = await self._extract_result(job_id, title, text, company)
+
+        logger.info(f"Completed parsing job {job_id}")
+        return result
+
+    async def parse_batch(self, jobs: List[Dict[str, Any]]) -> List[ParsedJobResult]:
+        """
+        Parse several job descriptions concurrently.
+
+        Args:
+            jobs: Dictionaries with job_id, title, text and optional company
+
+        Returns:
+            ParsedJobResult per job, in input order
+        """
+        logger.info(f"Starting to parse batch of {len(jobs)} jobs")
+
+        results = await asyncio.gather(*[
+            self._extract_result(job['job_id'], job['title'], job['text'], job.get('company'))
+            for job in jobs
+        ])
+
+        logger.info(f"Completed parsing batch of {len(jobs)} jobs")
+        return list(results)
+
+    async def parse_stages(
+        self,
+        title: str,
+        text: str,
+        company: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Run the extractors concurrently and yield each field as soon as it is ready.
+
+        Args:
+            title: Job title
+            text: Full job description text
+            company: Company name (optional)
+
+        Yields:
+            (field, value) pairs, finishing with confidence_scores
+        """
+        stages = [
+            ("skills", self.skill_extractor.extract_skills(text), []),
+            ("keywords", self.keyword_extractor.extract_keywords(text), []),
+            ("entities", self.nlp_processor.extract_named_entities(text), []),
+            ("experience_level", self._extract_experience_level(text), None),
+            ("education_level", self._extract_education_level(text), None),
+            ("salary_range", self._extract_salary_range(text), None),
+            ("location", self._extract_location(text), None),
+            ("job_type", self._extract_job_type(text), None),
+            ("benefits", self._extract_benefits(text), []),
+            ("responsibilities", self._extract_responsibilities(text), []),
+            ("qualifications", self._extract_qualifications(text), []),
+            ("technologies", self._extract_technologies(text), []),
+            ("soft_skills", self._extract_soft_skills(text), []),
+            ("industry_keywords", self._extract_industry_keywords(text, title, company), []),
+        ]
+
+        async def run_stage(field, coro, fallback):
+            try:
+                return field, await coro
+            except Exception as e:
+                logger.warning(f"Extraction of {field} failed: {e}")
+                return field, fallback
+
+        fields = {}
+        for next_stage in asyncio.as_completed([run_stage(*stage) for stage in stages]):
+            field, value = await next_stage
+            fields[field] = value
+            yield field, value
+
+        yield "confidence_scores", self._calculate_confidence_scores(
+            fields["skills"], fields["keywords"], text
+        )
+
+    async def _extract_result(
+        self,
+        job_id: str,
+        title: str,
+        text: str,
+        company: Optional[str],
+    ) -> ParsedJobResult:
+        """Run the field extractors over a job description"""
         # Extract information concurrently
         tasks = [
             self.skill_extractor.extract_skills(text),
@@ -159,7 +264,6 @@ class JobDescriptionParser:
             confidence_scores=confidence_scores,
         )
 
-        logger.info(f"Completed parsing job {job_id}")
         return result
 
     async def _extract_experience_level(self, text: str) -> Optional[str]:
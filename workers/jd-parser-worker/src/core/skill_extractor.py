@@ -4,21 +4,44 @@ Extracts technical and soft skills from job descriptions using NLP and pattern m
 """
 
 import re
+import sys
 import logging
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Pattern
 import asyncio
 from functools import lru_cache
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Regex patterns made only of plain characters (with optional escaped . + #)
+LITERAL_PATTERN = re.compile(r'(?:[^\\\[\](){}.*+?^$|]|\\[.+#])+')
+
 class SkillExtractor:
     """Extracts skills from job descriptions using multiple techniques"""
 
     def __init__(self):
-        # Comprehensive skill database
-        self.technical_skills = self._load_technical_skills()
+        # Comprehensive skill database, keyed by interned lowercase names and
+        # mapped back to the canonical display form
+        technical_skills = self._load_technical_skills()
         self.soft_skills = self._load_soft_skills()
+        self._skill_names = {
+            sys.intern(skill.lower()): skill
+            for skill in technical_skills + self.soft_skills
+        }
+        self._soft_skills_lower = frozenset(
+            sys.intern(skill.lower()) for skill in self.soft_skills
+        )
+
+        # Shared trie serving both keyword extraction and skill validation
+        self._skill_trie = self._build_skill_trie(self._skill_names)
         self.skill_patterns = self._load_skill_patterns()
+        self._pattern_trie, self._pattern_regexes = self._build_pattern_matchers(self.skill_patterns)
 
         # Skill categories for better organization
         self.skill_categories = {
@@ -64,31 +87,56 @@ class SkillExtractor:
 
     async def _extract_by_patterns(self, text: str) -> List[str]:
         """Extract skills using regex patterns"""
-        skills = []
-
-        for skill, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    skills.append(skill)
-                    break  # Only add skill once per pattern set
+        # Literal patterns are matched in one trie pass; only true regexes are searched
+        skills = self._scan_trie(self._pattern_trie, text)
+        skills.update(
+            skill for skill, regex in self._pattern_regexes
+            if skill not in skills and regex.search(text)
+        )
 
-        return skills
+        return list(skills)
 
     async def _extract_by_keywords(self, text: str) -> List[str]:
         """Extract skills by matching against keyword database"""
-        skills = []
+        return list(self._scan_trie(self._skill_trie, text))
 
-        # Check technical skills
-        for skill in self.technical_skills:
-            if skill.lower() in text:
-                skills.append(skill)
+    def _scan_trie(self, trie, text: str) -> Set[str]:
+        """Return the skills whose keys occur in text"""
+        if AHOCORASICK_AVAILABLE:
+            # Single pass over the text for the whole vocabulary
+            return {skill for _, skill in trie.iter(text)}
 
-        # Check soft skills
-        for skill in self.soft_skills:
-            if skill.lower() in text:
-                skills.append(skill)
+        return {skill for key, skill in trie.items() if key in text}
 
-        return skills
+    def _build_pattern_matchers(
+        self, skill_patterns: Dict[str, List[str]]
+    ) -> Tuple[object, List[Tuple[str, Pattern]]]:
+        """Split skill patterns into a literal trie and per-skill compiled regexes"""
+        literals: Dict[str, str] = {}
+        regexes: Dict[str, List[str]] = {}
+
+        for skill, patterns in skill_patterns.items():
+            for pattern in patterns:
+                if LITERAL_PATTERN.fullmatch(pattern):
+                    literals[pattern.replace('\\', '').lower()] = skill
+                else:
+                    regexes.setdefault(skill, []).append(pattern)
+
+        return self._build_skill_trie(literals), [
+            (skill, re.compile('|'.join(patterns), re.IGNORECASE))
+            for skill, patterns in regexes.items()
+        ]
+
+    def _build_skill_trie(self, skill_names: Dict[str, str]):
+        """Build the lowercase skill -> canonical name lookup structure"""
+        if not AHOCORASICK_AVAILABLE:
+            return skill_names
+
+        trie = ahocorasick.Automaton()
+        for key, skill in skill_names.items():
+            trie.add_word(key, skill)
+        trie.make_automaton()
+        return trie
 
     async def _extract_by_context(self, normalized_text: str, original_text: str) -> List[str]:
         """Extract skills based on context and surrounding words"""
@@ -301,7 +349,7 @@ class SkillExtractor:
                 categories['cloud_platforms'].append(skill)
             elif any(tool.lower() in skill_lower for tool in tools):
                 categories['tools'].append(skill)
-            elif skill in self.soft_skills:
+            elif skill_lower in self._soft_skills_lower:
                 categories['soft_skills'].append(skill)
             else:
                 categories['other'].append(skill)
@@ -329,6 +377,10 @@ class SkillExtractor:
         if len(skill) < 2 or len(skill) > 50:
             return False
 
+        # Known vocabulary entries are always valid
+        if skill.lower() in self._skill_names:
+            return True
+
         # Should not contain too many numbers
         if len(re.findall(r'\d', skill)) > len(skill) * 0.3:
             return False
@@ -7,7 +7,14 @@ import os
 import logging
 from typing import Dict, Any, Optional, List
 from contextlib import asynccontextmanager
-import json
+
+try:
+    import psycopg2
+    import psycopg2.extras
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+    psycopg2 = None
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +36,23 @@ class DatabaseManager:
 
         try:
             # Try to connect using psycopg2 if available
-            try:
-                import psycopg2
-                import psycopg2.extras
-
+            if PSYCOPG2_AVAILABLE:
                 self.connection = psycopg2.connect(self.connection_string)
                 self.connection.autocommit = True
-                logger.info("Connected to PostgreSQL database")
 
-            except ImportError:
+                # Plan the hot-path update once per session
+                with self.connection.cursor() as cursor:
+                    cursor.execute("""
+                        PREPARE store_parsed_job_stmt (jsonb, uuid) AS
+                        UPDATE jobs
+                        SET
+                            parsed_data = $1,
+                            updated_at = NOW()
+                        WHERE id = $2
+                    """)
+
+                logger.info("Connected to PostgreSQL database")
+            else:
                 logger.warning("psycopg2 not available, using mock database connection")
                 self.connection = None
 
@@ -60,21 +75,10 @@ class DatabaseManager:
             return
 
         try:
-            # Convert data to JSON for storage
-            skills_json = json.dumps(parsed_data.get("skills", []))
-            keywords_json = json.dumps(parsed_data.get("keywords", []))
-            confidence_scores_json = json.dumps(parsed_data.get("confidence_scores", {}))
-
             with self.connection.cursor() as cursor:
                 # Check if job exists, if not, this is just for logging
-                cursor.execute("""
-                    UPDATE jobs
-                    SET
-                        parsed_data = %s,
-                        updated_at = NOW()
-                    WHERE id = %s
-                """, (
-                    json.dumps({
+                cursor.execute("EXECUTE store_parsed_job_stmt (%s, %s)", (
+                    psycopg2.extras.Json({
                         "skills": parsed_data.get("skills", []),
                         "keywords": parsed_data.get("keywords", []),
                         "experience_level": parsed_data.get("experience_level"),
@@ -108,7 +112,7 @@ class DatabaseManager:
             return None
 
         try:
-            with self.connection.cursor(cursor_factory=None) as cursor:
+            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 cursor.execute("""
                     SELECT parsed_data
                     FROM jobs
@@ -116,8 +120,8 @@ class DatabaseManager:
                 """, (job_id,))
 
                 result = cursor.fetchone()
-                if result and result[0]:
-                    return result[0]
+                if result and result["parsed_data"]:
+                    return result["parsed_data"]
                 return None
 
         except Exception as e:
@@ -131,15 +135,14 @@ class DatabaseManager:
 
         try:
             with self.connection.cursor() as cursor:
-                for skill in skills:
-                    # Insert or update skill in taxonomy
-                    cursor.execute("""
-                        INSERT INTO skills_taxonomy (name, category, created_at, updated_at)
-                        VALUES (%s, 'extracted', NOW(), NOW())
-                        ON CONFLICT (name)
-                        DO UPDATE SET
-                            updated_at = NOW()
-                    """, (skill,))
+                # Insert or update skills in taxonomy
+                psycopg2.extras.execute_batch(cursor, """
+                    INSERT INTO skills_taxonomy (name, category, created_at, updated_at)
+                    VALUES (%s, 'extracted', NOW(), NOW())
+                    ON CONFLICT (name)
+                    DO UPDATE SET
+                        updated_at = NOW()
+                """, [(skill,) for skill in skills])
 
                 logger.info(f"Stored {len(skills)} skills in taxonomy")
 
@@ -152,7 +155,13 @@ class DatabaseManager:
             return []
 
         try:
-            with self.connection.cursor(cursor_factory=None) as cursor:
+            # Server-side cursor streams rows instead of materializing the
+            # whole result; withhold lets it live outside a transaction
+            with self.connection.cursor(
+                "skill_taxonomy_cursor",
+                cursor_factory=psycopg2.extras.RealDictCursor,
+                withhold=True,
+            ) as cursor:
                 cursor.execute("""
                     SELECT name, category, aliases, created_at
                     FROM skills_taxonomy
@@ -161,12 +170,12 @@ class DatabaseManager:
                 """, (limit,))
 
                 skills = []
-                for row in cursor.fetchall():
+                for row in cursor:
                     skills.append({
-                        "name": row[0],
-                        "category": row[1],
-                        "aliases": row[2] or [],
-                        "created_at": row[3].isoformat() if row[3] else None,
+                        "name": row["name"],
+                        "category": row["category"],
+                        "aliases": row["aliases"] or [],
+                        "created_at": row["created_at"].isoformat() if row["created_at"] else None,
                     })
 
                 return skills
@@ -181,46 +190,46 @@ class DatabaseManager:
             return {}
 
         try:
-            with self.connection.cursor(cursor_factory=None) as cursor:
+            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 # Get total jobs
-                cursor.execute("SELECT COUNT(*) FROM jobs")
-                total_jobs = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) AS total_jobs FROM jobs")
+                total_jobs = cursor.fetchone()["total_jobs"]
 
                 # Get jobs with parsed data
                 cursor.execute("""
-                    SELECT COUNT(*)
+                    SELECT COUNT(*) AS parsed_jobs
                     FROM jobs
                     WHERE parsed_data IS NOT NULL
                 """)
-                parsed_jobs = cursor.fetchone()[0]
+                parsed_jobs = cursor.fetchone()["parsed_jobs"]
 
                 # Get average confidence scores
                 cursor.execute("""
                     SELECT
-                        AVG((parsed_data->>'confidence_scores'->>'overall')::float) as avg_confidence,
+                        AVG((parsed_data->'confidence_scores'->>'overall')::float) as avg_confidence,
                         COUNT(*) as jobs_with_confidence
                     FROM jobs
                     WHERE parsed_data IS NOT NULL
-                    AND parsed_data->>'confidence_scores' IS NOT NULL
+                    AND parsed_data ? 'confidence_scores'
                 """)
 
                 confidence_result = cursor.fetchone()
-                avg_confidence = confidence_result[0] if confidence_result[0] else 0
-                jobs_with_confidence = confidence_result[1] if confidence_result[1] else 0
+                avg_confidence = confidence_result["avg_confidence"] or 0
+                jobs_with_confidence = confidence_result["jobs_with_confidence"] or 0
 
                 # Get skill extraction stats
                 cursor.execute("""
                     SELECT
-                        SUM(json_array_length(parsed_data->'skills')) as total_skills_extracted,
-                        AVG(json_array_length(parsed_data->'skills')) as avg_skills_per_job
+                        SUM(jsonb_array_length(parsed_data->'skills')) as total_skills_extracted,
+                        AVG(jsonb_array_length(parsed_data->'skills')) as avg_skills_per_job
                     FROM jobs
                     WHERE parsed_data IS NOT NULL
-                    AND json_array_length(parsed_data->'skills') > 0
+                    AND jsonb_array_length(parsed_data->'skills') > 0
                 """)
 
                 skills_result = cursor.fetchone()
-                total_skills = skills_result[0] if skills_result[0] else 0
-                avg_skills = skills_result[1] if skills_result[1] else 0
+                total_skills = skills_result["total_skills_extracted"] or 0
+                avg_skills = skills_result["avg_skills_per_job"] or 0
 
                 return {
                     "total_jobs": total_jobs,
@@ -236,21 +245,33 @@ class DatabaseManager:
             logger.error(f"Failed to get job parsing stats: {e}")
             return {}
 
-    async def cleanup_old_parsed_data(self, days_old: int = 90):
+    async def cleanup_old_parsed_data(self, days_old: int = 90, batch_size: int = 10000):
         """Clean up old parsed data to save space"""
         if not self.connection:
             return
 
         try:
             with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    UPDATE jobs
-                    SET parsed_data = NULL
-                    WHERE updated_at < NOW() - INTERVAL '%s days'
-                    AND parsed_data IS NOT NULL
-                """, (days_old,))
+                # Clear in batches so each statement (autocommitted) only
+                # locks a bounded number of rows
+                cleaned_count = 0
+                while True:
+                    cursor.execute("""
+                        UPDATE jobs
+                        SET parsed_data = NULL
+                        WHERE id IN (
+                            SELECT id
+                            FROM jobs
+                            WHERE parsed_data IS NOT NULL
+                            AND updated_at < NOW() - make_interval(days => %s)
+                            LIMIT %s
+                        )
+                    """, (days_old, batch_size))
+
+                    cleaned_count += cursor.rowcount
+                    if cursor.rowcount < batch_size:
+                        break
 
-                cleaned_count = cursor.rowcount
                 logger.info(f"Cleaned up parsed data for {cleaned_count} old jobs")
 
         except Exception as e:
@@ -263,10 +284,11 @@ class DatabaseManager:
 
         try:
             # This would use pgvector for similarity search
-            # For now, use basic text matching
+            # For now, use basic text matching. The skills filter uses the
+            # jsonb `?|` operator so it is served by idx_jobs_parsed_skills.
             skills_str = ' '.join(skills)
 
-            with self.connection.cursor(cursor_factory=None) as cursor:
+            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
                 cursor.execute("""
                     SELECT
                         id,
@@ -280,29 +302,25 @@ class DatabaseManager:
                         to_tsvector('english', COALESCE(description, ''))
                         @@ plainto_tsquery('english', %s)
                         OR
-                        EXISTS (
-                            SELECT 1
-                            FROM json_array_elements_text(parsed_data->'skills') as skill
-                            WHERE skill ILIKE ANY(%s)
-                        )
+                        parsed_data->'skills' ?| %s::text[]
                     )
                     ORDER BY relevance DESC
                     LIMIT %s
                 """, (
                     skills_str,
                     skills_str,
-                    [f'%{skill}%' for skill in skills],
+                    list(skills),
                     limit
                 ))
 
                 similar_jobs = []
                 for row in cursor.fetchall():
                     similar_jobs.append({
-                        "id": row[0],
-                        "title": row[1],
-                        "company": row[2],
-                        "parsed_data": row[3],
-                        "relevance": float(row[4]) if row[4] else 0,
+                        "id": row["id"],
+                        "title": row["title"],
+                        "company": row["company"],
+                        "parsed_data": row["parsed_data"],
+                        "relevance": float(row["relevance"]) if row["relevance"] else 0,
                     })
 
                 return similar_jobs
@@ -6,21 +6,27 @@ FastAPI application for parsing job descriptions and extracting skills, keywords
 import asyncio
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 import os
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+import httpx
+import msgspec
+import orjson
 import uvicorn
 import structlog
 
-from .core.parser import JobDescriptionParser
+from .core.parser import JobDescriptionParser, init_worker_parser
 from .core.nlp_processor import NLPProcessor
 from .core.skill_extractor import SkillExtractor
-from .core.keyword_extractor import KeywordExtractor
+from .core.keyword_extractor import KeywordExtractor, warmup_numba, NUMBA_AVAILABLE
 from .queue.task_queue import TaskQueue
+from .queue.parse_batcher import ParseBatcher
 from .database.connection import DatabaseManager
 
 # Configure structured logging
@@ -49,8 +55,35 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Wire models for the /parse hot path, decoded and encoded with msgspec
+class ParseJobRequest(msgspec.Struct, frozen=True):
+    job_id: str
+    title: str
+    description: str
+    requirements: Optional[str] = None
+    company: Optional[str] = None
+    callback_url: Optional[str] = None
+
+class ParsedJobResponse(msgspec.Struct):
+    job_id: str
+    skills: List[str] = []
+    keywords: List[str] = []
+    experience_level: Optional[str] = None
+    education_level: Optional[str] = None
+    salary_range: Optional[Dict[str, Any]] = None
+    location: Optional[str] = None
+    job_type: Optional[str] = None
+    benefits: List[str] = []
+    responsibilities: List[str] = []
+    qualifications: List[str] = []
+    technologies: List[str] = []
+    soft_skills: List[str] = []
+    industry_keywords: List[str] = []
+    confidence_scores: Dict[str, float] = {}
+
 # Pydantic models
-class ParseJobRequest(BaseModel):
+class ParseJobRequestSchema(BaseModel):
+    """OpenAPI schema for ParseJobRequest"""
     job_id: str = Field(..., description="Unique identifier for the job")
     title: str = Field(..., description="Job title")
     description: str = Field(..., description="Job description text")
@@ -58,7 +91,8 @@ class ParseJobRequest(BaseModel):
     company: Optional[str] = Field(None, description="Company name")
     callback_url: Optional[str] = Field(None, description="Webhook URL for results")
 
-class ParsedJobResponse(BaseModel):
+class ParsedJobResponseSchema(BaseModel):
+    """OpenAPI schema for ParsedJobResponse"""
     job_id: str
     skills: List[str] = Field(default_factory=list)
     keywords: List[str] = Field(default_factory=list)
@@ -80,15 +114,44 @@ class HealthResponse(BaseModel):
     version: str
     services: Dict[str, str]
 
+PARSE_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": ParseJobRequestSchema.model_json_schema()},
+        },
+    },
+}
+
+parse_request_decoder = msgspec.json.Decoder(ParseJobRequest)
+parse_response_encoder = msgspec.json.Encoder()
+
+async def decode_parse_request(request: Request) -> ParseJobRequest:
+    """Decode a ParseJobRequest body with msgspec instead of pydantic"""
+    try:
+        return parse_request_decoder.decode(await request.body())
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {str(e)}")
+
+def build_full_text(request: ParseJobRequest) -> str:
+    """Combine description and requirements for comprehensive analysis"""
+    full_text = f"{request.title}\n\n{request.description}"
+    if request.requirements:
+        full_text += f"\n\n{request.requirements}"
+    return full_text
+
 # Global instances
 parser: Optional[JobDescriptionParser] = None
+parse_batcher: Optional[ParseBatcher] = None
 task_queue: Optional[TaskQueue] = None
 db_manager: Optional[DatabaseManager] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global parser, task_queue, db_manager
+    global parser, parse_batcher, task_queue, db_manager
 
     logger.info("Starting JD Parser Worker")
 
@@ -101,15 +164,43 @@ async def lifespan(app: FastAPI):
         skill_extractor = SkillExtractor()
         keyword_extractor = KeywordExtractor()
 
+        # Pay JIT compile cost before serving traffic, not on the first request
+        if NUMBA_AVAILABLE:
+            await asyncio.to_thread(warmup_numba)
+            logger.info("Numba kernels warmed up")
+
         parser = JobDescriptionParser(
             nlp_processor=nlp_processor,
             skill_extractor=skill_extractor,
             keyword_extractor=keyword_extractor,
         )
 
+        # Parse batches in worker processes so NLP work never blocks the event loop;
+        # cores are shared between the uvicorn workers
+        web_concurrency = int(os.getenv("WEB_CONCURRENCY", "1"))
+        worker_count = max(1, (os.cpu_count() or 1) // web_concurrency)
+        app.state.pool = ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=init_worker_parser,
+        )
+
+        parse_batcher = ParseBatcher(
+            parser,
+            executor=app.state.pool,
+            max_concurrency=worker_count,
+        )
+        await parse_batcher.start()
+
         task_queue = TaskQueue()
         await task_queue.connect()
 
+        # Shared connection pool for webhook callbacks
+        app.state.http = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        )
+
         logger.info("JD Parser Worker started successfully")
 
         yield
@@ -119,6 +210,12 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         # Cleanup
+        if getattr(app.state, "http", None):
+            await app.state.http.aclose()
+        if parse_batcher:
+            await parse_batcher.stop()
+        if getattr(app.state, "pool", None):
+            app.state.pool.shutdown(wait=True, cancel_futures=True)
         if task_queue:
             await task_queue.disconnect()
         if db_manager:
@@ -131,6 +228,7 @@ app = FastAPI(
     description="AI-powered job description parsing and analysis service",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -168,28 +266,25 @@ async def health_check():
         services=services_status,
     )
 
-@app.post("/parse", response_model=ParsedJobResponse)
+@app.post("/parse", response_model=ParsedJobResponseSchema, openapi_extra=PARSE_REQUEST_OPENAPI)
 async def parse_job(
-    request: ParseJobRequest,
     background_tasks: BackgroundTasks,
+    request: ParseJobRequest = Depends(decode_parse_request),
 ):
     """
     Parse a job description and extract skills, keywords, and other information.
     Can be processed synchronously or asynchronously based on complexity.
     """
-    if not parser:
+    if not parser or not parse_batcher:
         raise HTTPException(status_code=503, detail="Parser service unavailable")
 
     try:
-        # Combine description and requirements for comprehensive analysis
-        full_text = f"{request.title}\n\n{request.description}"
-        if request.requirements:
-            full_text += f"\n\n{request.requirements}"
+        full_text = build_full_text(request)
 
         logger.info("Starting job description parsing", job_id=request.job_id)
 
-        # Parse the job description
-        result = await parser.parse(
+        # Parse the job description as part of the next micro-batch
+        result = await parse_batcher.parse(
             job_id=request.job_id,
             title=request.title,
             text=full_text,
@@ -214,13 +309,14 @@ async def parse_job(
             industry_keywords=result.industry_keywords,
             confidence_scores=result.confidence_scores,
         )
+        response_data = msgspec.to_builtins(response)
 
         # Store results in database if manager is available
         if db_manager:
             background_tasks.add_task(
                 db_manager.store_parsed_job,
                 request.job_id,
-                result,
+                response_data,
             )
 
         # Send webhook callback if provided
@@ -228,18 +324,50 @@ async def parse_job(
             background_tasks.add_task(
                 send_webhook_callback,
                 request.callback_url,
-                response.dict(),
+                response_data,
             )
 
         logger.info("Job description parsing completed", job_id=request.job_id)
-        return response
+        # Returning a Response directly bypasses response_model re-validation
+        return Response(parse_response_encoder.encode(response), media_type="application/json")
 
     except Exception as e:
         logger.error("Failed to parse job description", job_id=request.job_id, error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to parse job description: {str(e)}")
 
-@app.post("/parse/async")
-async def parse_job_async(request: ParseJobRequest):
+@app.post("/parse/stream", openapi_extra=PARSE_REQUEST_OPENAPI)
+async def parse_job_stream(request: ParseJobRequest = Depends(decode_parse_request)):
+    """
+    Parse a job description and stream each extracted field as a Server-Sent Event.
+    Clients can render skills and keywords before the slower fields are ready.
+    """
+    if not parser:
+        raise HTTPException(status_code=503, detail="Parser service unavailable")
+
+    full_text = build_full_text(request)
+
+    async def event_stream():
+        logger.info("Starting streamed job description parsing", job_id=request.job_id)
+
+        try:
+            async for field, value in parser.parse_stages(
+                title=request.title,
+                text=full_text,
+                company=request.company,
+            ):
+                yield b"data: " + orjson.dumps({field: value}) + b"\n\n"
+        except Exception as e:
+            logger.error("Failed to stream job description parsing", job_id=request.job_id, error=str(e))
+            yield b"event: error\ndata: " + orjson.dumps({"detail": str(e)}) + b"\n\n"
+            return
+
+        yield b"event: done\ndata: " + orjson.dumps({"job_id": request.job_id}) + b"\n\n"
+        logger.info("Streamed job description parsing completed", job_id=request.job_id)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.post("/parse/async", openapi_extra=PARSE_REQUEST_OPENAPI)
+async def parse_job_async(request: ParseJobRequest = Depends(decode_parse_request)):
     """
     Queue a job description for asynchronous parsing.
     Returns immediately with a task ID for status checking.
@@ -249,14 +377,7 @@ async def parse_job_async(request: ParseJobRequest):
 
     try:
         # Add to queue for processing
-        task_id = await task_queue.add_task("parse_job", {
-            "job_id": request.job_id,
-            "title": request.title,
-            "description": request.description,
-            "requirements": request.requirements,
-            "company": request.company,
-            "callback_url": request.callback_url,
-        })
+        task_id = await task_queue.add_task("parse_job", msgspec.structs.asdict(request))
 
         return {
             "task_id": task_id,
@@ -314,18 +435,30 @@ async def extract_keywords(text: str):
 async def send_webhook_callback(url: str, data: dict):
     """Send webhook callback with parsing results"""
     try:
-        import httpx
-        async with httpx.AsyncClient() as client:
-            await client.post(url, json=data, timeout=30.0)
+        await app.state.http.post(
+            url,
+            content=orjson.dumps(data),
+            headers={"content-type": "application/json"},
+        )
         logger.info("Webhook callback sent successfully", url=url)
     except Exception as e:
         logger.error("Failed to send webhook callback", url=url, error=str(e))
 
 if __name__ == "__main__":
+    development = os.getenv("ENVIRONMENT") == "development"
+    web_concurrency = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    os.environ["WEB_CONCURRENCY"] = str(web_concurrency)
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8000")),
-        reload=os.getenv("ENVIRONMENT") == "development",
+        reload=development,
+        workers=None if development else web_concurrency,
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        limit_concurrency=1000,
+        log_config=None,
         log_level="info",
     )
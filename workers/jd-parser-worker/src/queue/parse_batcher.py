@@ -0,0 +1,141 @@
+"""
+Parse Batcher
+Coalesces concurrent parse requests into micro-batches for JobDescriptionParser.parse_batch.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import xxhash
+from cachetools import LRUCache
+
+from ..core.parser import JobDescriptionParser, ParsedJobResult, parse_batch_in_worker
+
+logger = logging.getLogger(__name__)
+
+class ParseBatcher:
+    """Micro-batching front end for the job description parser"""
+
+    def __init__(
+        self,
+        parser: JobDescriptionParser,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 20.0,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 1,
+        result_cache_size: int = 4096,
+    ):
+        self.parser = parser
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        # When set, batches are parsed by parse_batch_in_worker off the event loop
+        self.executor = executor
+        self.queue: asyncio.Queue[Tuple[Dict[str, Any], asyncio.Future]] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Set[asyncio.Task] = set()
+        self._worker: Optional[asyncio.Task] = None
+        # Reposted job descriptions parse identically, whatever their job_id
+        self.result_cache: LRUCache = LRUCache(maxsize=result_cache_size)
+
+    async def start(self):
+        """Start the background coalescer"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+            logger.info("Parse batcher started")
+
+    async def stop(self):
+        """Stop the coalescer and fail any requests still waiting"""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        while not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Parse batcher stopped"))
+
+        logger.info("Parse batcher stopped")
+
+    async def parse(
+        self,
+        job_id: str,
+        title: str,
+        text: str,
+        company: Optional[str] = None,
+    ) -> ParsedJobResult:
+        """Queue a job description and wait for its batch to be parsed"""
+        cache_key = xxhash.xxh3_64_intdigest(f"{company or ''}\0{text}")
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            return replace(cached, job_id=job_id)
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(({
+            "job_id": job_id,
+            "title": title,
+            "text": text,
+            "company": company,
+        }, future))
+        result = await future
+
+        self.result_cache[cache_key] = result
+        return result
+
+    async def _next_batch(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        """Collect up to max_batch_size requests, waiting at most max_wait after the first"""
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        """Coalesce queued requests and dispatch up to max_concurrency batches at once"""
+        while True:
+            batch = await self._next_batch()
+            await self._slots.acquire()
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Parse one batch and resolve its futures"""
+        jobs = [job for job, _ in batch]
+
+        try:
+            if self.executor:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(self.executor, parse_batch_in_worker, jobs)
+            else:
+                results = await self.parser.parse_batch(jobs)
+        except Exception as e:
+            logger.error(f"Batch parse failed for {len(jobs)} jobs: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -3,15 +3,23 @@ Task Queue
 Handles asynchronous job description parsing tasks using Redis/Celery or NATS.
 """
 
-import json
-import uuid
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import time
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime
+from collections import Counter
 import asyncio
 
+import orjson
+import uuid_utils
+from cachetools import TTLCache
+
 logger = logging.getLogger(__name__)
 
+TASK_TTL_SECONDS = 3600
+TASK_CREATED_INDEX = "task:created_idx"
+CLEANUP_CHUNK_SIZE = 500
+
 class TaskStatus:
     PENDING = "pending"
     PROCESSING = "processing"
@@ -20,23 +28,48 @@ class TaskStatus:
     CANCELLED = "cancelled"
 
 class TaskResult:
+    # Status changes create a new TaskResult, so instances are never mutated
+    __slots__ = ("task_id", "status", "result", "error", "created_at", "completed_at", "_dict_cache")
+
     def __init__(self, task_id: str, status: str, result: Optional[Any] = None, error: Optional[str] = None):
         self.task_id = task_id
         self.status = status
         self.result = result
         self.error = error
         self.created_at = datetime.now()
-        self.completed_at = datetime.now() if status in [TaskStatus.COMPLETED, TaskStatus.FAILED] else None
+        self.completed_at = self.created_at if status in (TaskStatus.COMPLETED, TaskStatus.FAILED) else None
+        self._dict_cache: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "task_id": self.task_id,
-            "status": self.status,
-            "result": self.result,
-            "error": self.error,
-            "created_at": self.created_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "task_id": self.task_id,
+                "status": self.status,
+                "result": self.result,
+                "error": self.error,
+                "created_at": self.created_at.isoformat(),
+                "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            }
+        # Callers own the returned dict; the cached one stays untouched
+        return dict(self._dict_cache)
+
+class TaskResultCache(TTLCache):
+    """TTLCache that reports evicted and expired results to a callback"""
+
+    def __init__(self, maxsize: int, ttl: float, on_evict):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._on_evict(value)
+        return key, value
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _, value in expired:
+            self._on_evict(value)
+        return expired
 
 class TaskQueue:
     """Asynchronous task queue for job description parsing"""
@@ -46,7 +79,12 @@ class TaskQueue:
         self.nats_url = nats_url or "nats://localhost:4222"
         self.redis = None
         self.nats = None
-        self.task_results: Dict[str, TaskResult] = {}
+        self.js = None
+        self._counts: Counter = Counter()
+        # Hot cache only; Redis remains the system of record for task state
+        self.task_results: Dict[str, TaskResult] = TaskResultCache(
+            maxsize=10_000, ttl=TASK_TTL_SECONDS, on_evict=self._forget_result
+        )
         self._initialized = False
 
     async def connect(self):
@@ -69,10 +107,19 @@ class TaskQueue:
             try:
                 import nats
                 self.nats = await nats.connect(self.nats_url)
-                logger.info("Connected to NATS for task queue")
+                self.js = self.nats.jetstream()
+                await self.js.add_stream(name="jd_tasks", subjects=["job_parser.tasks"])
+                logger.info("Connected to NATS JetStream for task queue")
             except Exception as e:
                 logger.warning(f"NATS connection failed: {e}")
+                # Stream setup can fail after connecting; don't leak the client
+                if self.nats:
+                    try:
+                        await self.nats.close()
+                    except Exception as close_error:
+                        logger.warning(f"Failed to close NATS connection: {close_error}")
                 self.nats = None
+                self.js = None
 
             if not self.redis and not self.nats:
                 raise Exception("Neither Redis nor NATS is available for task queue")
@@ -92,39 +139,95 @@ class TaskQueue:
             await self.nats.close()
         self._initialized = False
 
-    async def add_task(self, task_type: str, payload: Dict[str, Any]) -> str:
-        """Add a task to the queue"""
-        if not self._initialized:
-            await self.connect()
+    def _set_result(self, task_result: TaskResult):
+        """Store a task result, keeping the per-status counters in step"""
+        previous = self.task_results.get(task_result.task_id)
+        if previous is not None:
+            self._counts[previous.status] -= 1
+        self._counts[task_result.status] += 1
+        self.task_results[task_result.task_id] = task_result
+
+    def _forget_result(self, task_result: TaskResult):
+        """Drop an evicted task result from the per-status counters"""
+        self._counts[task_result.status] -= 1
 
-        task_id = str(uuid.uuid4())
-        task_data = {
+    def _new_task(self, task_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the queued representation of a task and register its placeholder result"""
+        # Time-ordered ids; the created index still drives cleanup
+        task_id = str(uuid_utils.uuid7())
+
+        # Store task result placeholder
+        self._set_result(TaskResult(task_id, TaskStatus.PENDING))
+
+        return {
             "task_id": task_id,
             "task_type": task_type,
             "payload": payload,
             "status": TaskStatus.PENDING,
-            "created_at": datetime.now().isoformat(),
+            "created_at": datetime.now(),
         }
 
-        # Store task result placeholder
-        self.task_results[task_id] = TaskResult(task_id, TaskStatus.PENDING)
+    async def add_task(self, task_type: str, payload: Dict[str, Any]) -> str:
+        """Add a task to the queue"""
+        if not self._initialized:
+            await self.connect()
+
+        task_data = self._new_task(task_type, payload)
+        task_id = task_data["task_id"]
 
         try:
             if self.redis:
-                # Use Redis as queue
-                await self.redis.setex(f"task:{task_id}", 3600, json.dumps(task_data))
-                await self.redis.lpush("job_parser_queue", task_id)
+                # Use Redis as queue; SETEX and LPUSH share one round-trip
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.setex(f"task:{task_id}", TASK_TTL_SECONDS, orjson.dumps(task_data))
+                    pipe.lpush("job_parser_queue", task_id)
+                    pipe.zadd(TASK_CREATED_INDEX, {task_id: time.time()})
+                    await pipe.execute()
                 logger.info(f"Task {task_id} added to Redis queue")
             elif self.nats:
                 # Use NATS for queuing
-                await self.nats.publish("job_parser.tasks", json.dumps(task_data).encode())
+                # JetStream publish waits for the stream's ack
+                await self.js.publish("job_parser.tasks", orjson.dumps(task_data))
                 logger.info(f"Task {task_id} published to NATS")
 
             return task_id
 
         except Exception as e:
             logger.error(f"Failed to add task {task_id}: {e}")
-            self.task_results[task_id] = TaskResult(task_id, TaskStatus.FAILED, error=str(e))
+            self._set_result(TaskResult(task_id, TaskStatus.FAILED, error=str(e)))
+            raise
+
+    async def add_tasks(self, batch: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Add several (task_type, payload) tasks to the queue in one round-trip"""
+        if not self._initialized:
+            await self.connect()
+
+        tasks = [self._new_task(task_type, payload) for task_type, payload in batch]
+        task_ids = [task_data["task_id"] for task_data in tasks]
+
+        try:
+            if self.redis:
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    for task_data in tasks:
+                        pipe.setex(f"task:{task_data['task_id']}", TASK_TTL_SECONDS, orjson.dumps(task_data))
+                        pipe.lpush("job_parser_queue", task_data["task_id"])
+                    created = time.time()
+                    pipe.zadd(TASK_CREATED_INDEX, {task_id: created for task_id in task_ids})
+                    await pipe.execute()
+                logger.info(f"{len(tasks)} tasks added to Redis queue")
+            elif self.nats:
+                await asyncio.gather(*[
+                    self.js.publish("job_parser.tasks", orjson.dumps(task_data))
+                    for task_data in tasks
+                ])
+                logger.info(f"{len(tasks)} tasks published to NATS")
+
+            return task_ids
+
+        except Exception as e:
+            logger.error(f"Failed to add {len(tasks)} tasks: {e}")
+            for task_id in task_ids:
+                self._set_result(TaskResult(task_id, TaskStatus.FAILED, error=str(e)))
             raise
 
     async def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -138,7 +241,7 @@ class TaskQueue:
             try:
                 task_data = await self.redis.get(f"task:{task_id}")
                 if task_data:
-                    return json.loads(task_data)
+                    return orjson.loads(task_data)
             except Exception as e:
                 logger.warning(f"Failed to get task status from Redis: {e}")
 
@@ -155,13 +258,13 @@ class TaskQueue:
         task_result = TaskResult(task_id, status, result, error)
 
         # Update in-memory storage
-        self.task_results[task_id] = task_result
+        self._set_result(task_result)
 
         # Update Redis if available
         if self.redis:
             try:
                 task_data = task_result.to_dict()
-                await self.redis.setex(f"task:{task_id}", 3600, json.dumps(task_data))
+                await self.redis.setex(f"task:{task_id}", TASK_TTL_SECONDS, orjson.dumps(task_data))
             except Exception as e:
                 logger.warning(f"Failed to update task status in Redis: {e}")
 
@@ -241,54 +344,36 @@ class TaskQueue:
 
     async def cleanup_old_tasks(self, max_age_hours: int = 24):
         """Clean up old completed/failed tasks"""
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        expired = []
 
         if self.redis:
             try:
-                # Get all task keys
-                task_keys = await self.redis.keys("task:*")
-
-                for key in task_keys:
-                    task_data_str = await self.redis.get(key)
-                    if task_data_str:
-                        task_data = json.loads(task_data_str)
-                        created_at = datetime.fromisoformat(task_data["created_at"])
-
-                        if created_at < cutoff_time:
-                            await self.redis.delete(key)
+                # Task blobs also expire via SETEX; the index tells us which ones are old
+                expired = await self.redis.zrangebyscore(
+                    TASK_CREATED_INDEX, 0, time.time() - max_age_hours * 3600
+                )
+
+                for i in range(0, len(expired), CLEANUP_CHUNK_SIZE):
+                    chunk = expired[i:i + CLEANUP_CHUNK_SIZE]
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        pipe.delete(*[f"task:{task_id}" for task_id in chunk])
+                        pipe.zrem(TASK_CREATED_INDEX, *chunk)
+                        await pipe.execute()
 
             except Exception as e:
                 logger.error(f"Failed to cleanup old tasks: {e}")
 
-        # Clean in-memory storage
-        to_remove = []
-        for task_id, task_result in self.task_results.items():
-            if task_result.created_at < cutoff_time:
-                to_remove.append(task_id)
-
-        for task_id in to_remove:
-            del self.task_results[task_id]
+        # In-memory results age out on their own; just purge what has expired
+        self.task_results.expire()
 
-        logger.info(f"Cleaned up {len(to_remove)} old tasks")
+        logger.info(f"Cleaned up {len(expired)} old tasks")
 
     async def get_queue_stats(self) -> Dict[str, Any]:
         """Get queue statistics"""
-        stats = {
-            "total_tasks": len(self.task_results),
-            "pending_tasks": 0,
-            "processing_tasks": 0,
-            "completed_tasks": 0,
-            "failed_tasks": 0,
+        return {
+            "total_tasks": sum(self._counts.values()),
+            "pending_tasks": self._counts[TaskStatus.PENDING],
+            "processing_tasks": self._counts[TaskStatus.PROCESSING],
+            "completed_tasks": self._counts[TaskStatus.COMPLETED],
+            "failed_tasks": self._counts[TaskStatus.FAILED],
         }
-
-        for task_result in self.task_results.values():
-            if task_result.status == TaskStatus.PENDING:
-                stats["pending_tasks"] += 1
-            elif task_result.status == TaskStatus.PROCESSING:
-                stats["processing_tasks"] += 1
-            elif task_result.status == TaskStatus.COMPLETED:
-                stats["completed_tasks"] += 1
-            elif task_result.status == TaskStatus.FAILED:
-                stats["failed_tasks"] += 1
-
-        return stats
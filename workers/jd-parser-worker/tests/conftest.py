@@ -0,0 +1,40 @@
+"""
+Shared fixtures for JD Parser Worker tests
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def nlp_processor():
+    try:
+        from src.core.nlp_processor import NLPProcessor
+    except ImportError as e:
+        pytest.skip(f"Missing dependencies: {e}")
+    return NLPProcessor()
+
+
+@pytest.fixture(scope="session")
+def skill_extractor():
+    from src.core.skill_extractor import SkillExtractor
+    return SkillExtractor()
+
+
+@pytest.fixture(scope="session")
+def keyword_extractor():
+    from src.core.keyword_extractor import KeywordExtractor
+    return KeywordExtractor()
+
+
+@pytest.fixture(scope="session")
+def parser(nlp_processor, skill_extractor, keyword_extractor):
+    """Job description parser built once for the whole test session"""
+    try:
+        from src.core.parser import JobDescriptionParser
+    except ImportError as e:
+        pytest.skip(f"Missing dependencies: {e}")
+    return JobDescriptionParser(
+        nlp_processor=nlp_processor,
+        skill_extractor=skill_extractor,
+        keyword_extractor=keyword_extractor,
+    )
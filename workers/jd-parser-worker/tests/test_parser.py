@@ -2,17 +2,17 @@
 Basic tests for JD Parser Worker
 """
 
+import asyncio
+
 import pytest
-from src.core.skill_extractor import SkillExtractor
-from src.core.keyword_extractor import KeywordExtractor
 
 
 class TestSkillExtractor:
     """Test skill extraction functionality"""
 
     @pytest.fixture
-    def extractor(self):
-        return SkillExtractor()
+    def extractor(self, skill_extractor):
+        return skill_extractor
 
     def test_extract_skills_basic(self, extractor):
         """Test basic skill extraction"""
@@ -46,8 +46,8 @@ class TestKeywordExtractor:
     """Test keyword extraction functionality"""
 
     @pytest.fixture
-    def extractor(self):
-        return KeywordExtractor()
+    def extractor(self, keyword_extractor):
+        return keyword_extractor
 
     def test_extract_keywords_basic(self, extractor):
         """Test basic keyword extraction"""
@@ -74,79 +74,84 @@ class TestKeywordExtractor:
         assert relevance > 0
         assert relevance <= 1
 
+    def test_match_token_hashes(self):
+        """Test token-hash sequence matching on a real match"""
+        from src.core.keyword_extractor import hash_tokens, match_token_hashes
+
+        token_hashes = hash_tokens("Python developer with Python experience and machine learning")
+
+        frequency, first_index = match_token_hashes(token_hashes, hash_tokens("python"))
+        assert (frequency, first_index) == (2, 0)
+
+        frequency, first_index = match_token_hashes(token_hashes, hash_tokens("machine learning"))
+        assert (frequency, first_index) == (1, 6)
+
+        assert match_token_hashes(token_hashes, hash_tokens("rust")) == (0, -1)
+
+    def test_warmup_numba(self):
+        """Test that kernel warmup runs cleanly"""
+        from src.core.keyword_extractor import warmup_numba
+
+        warmup_numba()
+
 
 class TestIntegration:
     """Integration tests for the parser"""
 
-    def test_parser_import(self):
+    def test_parser_import(self, parser):
         """Test that parser can be imported"""
-        try:
-            from src.core.parser import JobDescriptionParser
-            from src.core.nlp_processor import NLPProcessor
-            from src.core.skill_extractor import SkillExtractor
-            from src.core.keyword_extractor import KeywordExtractor
-
-            # Create instances
-            nlp_processor = NLPProcessor()
-            skill_extractor = SkillExtractor()
-            keyword_extractor = KeywordExtractor()
-            parser = JobDescriptionParser(
-                nlp_processor=nlp_processor,
-                skill_extractor=skill_extractor,
-                keyword_extractor=keyword_extractor,
-            )
-
-            assert parser is not None
-            assert nlp_processor is not None
-            assert skill_extractor is not None
-            assert keyword_extractor is not None
-
-        except ImportError as e:
-            pytest.skip(f"Missing dependencies: {e}")
-
-    def test_sample_job_parsing(self):
+        assert parser is not None
+        assert parser.nlp_processor is not None
+        assert parser.skill_extractor is not None
+        assert parser.keyword_extractor is not None
+
+    def test_sample_job_parsing(self, parser):
         """Test parsing a sample job description"""
-        try:
-            from src.core.parser import JobDescriptionParser
-            from src.core.nlp_processor import NLPProcessor
-            from src.core.skill_extractor import SkillExtractor
-            from src.core.keyword_extractor import KeywordExtractor
-
-            # Create parser
-            nlp_processor = NLPProcessor()
-            skill_extractor = SkillExtractor()
-            keyword_extractor = KeywordExtractor()
-            parser = JobDescriptionParser(
-                nlp_processor=nlp_processor,
-                skill_extractor=skill_extractor,
-                keyword_extractor=keyword_extractor,
-            )
-
-            # Sample job description
-            job_text = """
-            Senior Python Developer
-
-            We are looking for a Senior Python Developer with 5+ years of experience.
-            You should have strong skills in Python, Django, React, and AWS.
-            Experience with machine learning and data science is a plus.
-
-            Requirements:
-            - Bachelor's degree in Computer Science or related field
-            - 5+ years of Python development experience
-            - Experience with web frameworks (Django, Flask)
-            - Knowledge of cloud platforms (AWS, Azure)
-            - Strong problem-solving skills
-            """
-
-            # This would normally be an async test
-            # For now, just check that the parser can be created
-            assert parser is not None
-            assert hasattr(parser, 'parse')
-            assert hasattr(parser, 'skill_extractor')
-            assert hasattr(parser, 'keyword_extractor')
-
-        except ImportError as e:
-            pytest.skip(f"Missing dependencies: {e}")
+        # Sample job description
+        job_text = """
+        Senior Python Developer
+
+        We are looking for a Senior Python Developer with 5+ years of experience.
+        You should have strong skills in Python, Django, React, and AWS.
+        Experience with machine learning and data science is a plus.
+
+        Requirements:
+        - Bachelor's degree in Computer Science or related field
+        - 5+ years of Python development experience
+        - Experience with web frameworks (Django, Flask)
+        - Knowledge of cloud platforms (AWS, Azure)
+        - Strong problem-solving skills
+        """
+
+        # This would normally be an async test
+        # For now, just check that the parser can be created
+        assert parser is not None
+        assert hasattr(parser, 'parse')
+        assert hasattr(parser, 'skill_extractor')
+        assert hasattr(parser, 'keyword_extractor')
+
+    def test_parse_batch(self, parser):
+        """Batch parsing matches parsing each job on its own"""
+        jobs = [
+            {
+                'job_id': 'job-1',
+                'title': 'Python Developer',
+                'text': 'Python developer with 3+ years of experience in Django and AWS. Full time.',
+            },
+            {
+                'job_id': 'job-2',
+                'title': 'Data Scientist',
+                'text': "Master's degree required. Machine learning, SQL and Spark skills.",
+                'company': 'Acme',
+            },
+        ]
+
+        results = asyncio.run(parser.parse_batch(jobs))
+
+        assert [result.job_id for result in results] == ['job-1', 'job-2']
+        for job, result in zip(jobs, results):
+            expected = asyncio.run(parser.parse(job['job_id'], job['title'], job['text'], job.get('company')))
+            assert result == expected
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+"""
+Ahead-of-time build of the gap analyzer tokenizer.
+
+Run once per image/platform (python build_aot.py) to produce src/core/gap_tokenizer*.so.
+When present, the gap analyzer imports it instead of JIT-compiling scan_tokens,
+so worker cold starts pay no Numba compilation.
+"""
+
+import importlib.util
+import os
+
+from numba.pycc import CC
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORE_DIR = os.path.join(HERE, "src", "core")
+
+
+def load_kernels():
+    """Load gap_kernels by path, without importing the rest of the package"""
+    spec = importlib.util.spec_from_file_location("gap_kernels", os.path.join(CORE_DIR, "gap_kernels.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    kernels = load_kernels()
+
+    cc = CC("gap_tokenizer")
+    cc.output_dir = CORE_DIR
+    cc.export("scan_tokens", "i8[:,:](u1[:])")(kernels.scan_tokens_impl)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    main()
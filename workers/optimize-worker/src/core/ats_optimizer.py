@@ -4,13 +4,51 @@ Optimizes resumes for Applicant Tracking Systems with improved parsing, keyword
 """
 
 import re
+import json
+import heapq
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Iterator, ClassVar
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+ANALYSIS_CACHE_SIZE = 256
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def repetition_penalty(hashes):
+        """Penalty of 2 per occurrence beyond the fifth, for each distinct word hash"""
+        ordered = np.sort(hashes)
+        penalty = 0
+        run = 1
+        for i in range(1, ordered.size):
+            if ordered[i] == ordered[i - 1]:
+                run += 1
+            else:
+                if run > 5:
+                    penalty += (run - 5) * 2
+                run = 1
+        if ordered.size and run > 5:
+            penalty += (run - 5) * 2
+        return penalty
+
 class ATSRule(Enum):
     """Common ATS rules and requirements"""
     KEYWORD_MATCHING = "keyword_matching"
@@ -19,7 +57,7 @@ class ATSRule(Enum):
     CONTENT_OPTIMIZATION = "content_optimization"
     FILE_FORMAT = "file_format"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ATSIssue:
     """Represents an ATS compatibility issue"""
     rule: ATSRule
@@ -28,7 +66,7 @@ class ATSIssue:
     location: str  # section name or 'general'
     suggestion: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ATSRecommendation:
     """Represents an ATS optimization recommendation"""
     priority: int  # 1-10, higher is more important
@@ -40,6 +78,33 @@ class ATSRecommendation:
 class ATSOptimizer:
     """Optimizes resumes for ATS compatibility and parsing"""
 
+    # Common ATS system requirements
+    _ATS_REQUIREMENTS: ClassVar[Dict[str, Dict[str, Any]]] = {
+        "workday": {
+            "max_sections": 15,
+            "preferred_format": "docx",
+            "section_headers": ["experience", "education", "skills"],
+        },
+        "taleo": {
+            "max_file_size": 5 * 1024 * 1024,  # 5MB
+            "avoid_tables": True,
+            "simple_formatting": True,
+        },
+        "icims": {
+            "max_sections": 10,
+            "standard_headers": True,
+            "keyword_focus": True,
+        },
+        "greenhouse": {
+            "parsing_focus": True,
+            "section_structure": True,
+            "contact_info": True,
+        },
+    }
+
+    # Headers ICIMS-style parsers expect to find
+    _STANDARD_HEADERS: ClassVar[Tuple[str, ...]] = ("experience", "education", "skills", "summary")
+
     def __init__(self):
         # Common ATS parsing issues and solutions
         self.parsing_issues = {
@@ -91,6 +156,71 @@ class ATSOptimizer:
             "certifications": ["certifications", "certificates", "credentials", "licenses"],
             "projects": ["projects", "portfolio", "work samples", "achievements"],
         }
+        self._section_matcher = self._build_section_matcher(self.section_keywords)
+
+        # Conventional section order (having these sections is better for ATS)
+        self._conventional_order = ("contact", "summary", "experience", "education", "skills")
+
+        # Standard section headers for ATS parsing
+        self.header_mappings = {
+            "work experience": "EXPERIENCE",
+            "professional experience": "EXPERIENCE",
+            "work history": "EXPERIENCE",
+            "employment": "EXPERIENCE",
+            "academic background": "EDUCATION",
+            "educational background": "EDUCATION",
+            "school": "EDUCATION",
+            "technical skills": "SKILLS",
+            "competencies": "SKILLS",
+            "expertise": "SKILLS",
+            "technologies": "SKILLS",
+            "certifications": "CERTIFICATIONS",
+            "credentials": "CERTIFICATIONS",
+            "licenses": "CERTIFICATIONS",
+            "projects": "PROJECTS",
+            "portfolio": "PROJECTS",
+        }
+
+        # Precompiled patterns shared by the analyzers and cleaners
+        self._issue_type_res = {
+            issue_type: re.compile('|'.join(issue_config["patterns"]), re.IGNORECASE)
+            for issue_type, issue_config in self.parsing_issues.items()
+        }
+        # All parsing-issue patterns fused into one alternation, one named group per type
+        self._issues_re = re.compile(
+            '|'.join(
+                f'(?P<{issue_type}>{pattern.pattern})'
+                for issue_type, pattern in self._issue_type_res.items()
+            ),
+            re.IGNORECASE,
+        )
+        self._re_word = re.compile(r'\b\w+\b')
+        self._re_ws = re.compile(r'\s+')
+        self._bad_chars = frozenset('•●○▪▫♦★☆')
+        # Single-character cleanups: fancy bullets and smart quotes
+        self._clean_trans = str.maketrans({
+            **{char: '•' for char in '●○▪▫♦★☆'},
+            **{char: '"' for char in '\u201c\u201d\u201e'},
+            **{char: "'" for char in '\u2018\u2019\u201a'},
+        })
+        # A non-blank line that, once stripped, starts with a bullet or number
+        self._re_structured_line = re.compile(r'^[^\S\n]*[-\*\•\d]+\.?[^\S\n]+\S', re.MULTILINE)
+        self._re_nonblank_line = re.compile(r'^[^\S\n]*\S', re.MULTILINE)
+        self._re_bullet_prefix = re.compile(r'^[-\*\•\d]+\.?\s*')
+        self._re_bullet_styles = [
+            re.compile(pattern, re.MULTILINE)
+            for pattern in (r'^[-\*\•]', r'^\d+\.', r'^[a-zA-Z]\.')
+        ]
+        self._re_section_split = re.compile(r'\n\s*\n')
+        self._re_whitespace_blank_line = re.compile(r'\n[^\S\n]+\n')
+        self._re_table = re.compile(r'\|\s*\|')
+        self._re_date = re.compile(r'(\w+)\s+(\d{4})')
+
+        # Extracted text per resume dict, keyed by id() and cleared per public call
+        self._text_cache: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+        # Compatibility analyses keyed by content digest (LRU)
+        self._analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
     async def optimize_for_ats(
         self,
@@ -109,20 +239,21 @@ class ATSOptimizer:
         """
         try:
             logger.info("Starting ATS optimization")
+            self._text_cache.clear()
 
             # Analyze current ATS compatibility
-            analysis = await self._analyze_ats_compatibility(resume_content)
+            analysis = self._analyze_ats_compatibility(resume_content)
 
             # Generate optimization recommendations
-            recommendations = await self._generate_ats_recommendations(analysis)
+            recommendations = self._generate_ats_recommendations(analysis)
 
             # Apply ATS optimizations
-            optimized_content = await self._apply_ats_optimizations(
+            optimized_content = self._apply_ats_optimizations(
                 resume_content, analysis, ats_rules
             )
 
             # Calculate ATS score
-            ats_score = await self._calculate_ats_score(optimized_content)
+            ats_score = self._calculate_ats_score(optimized_content)
 
             # Prepare result
             result = {
@@ -158,37 +289,76 @@ class ATSOptimizer:
                 "recommendations": [],
             }
 
-    async def _analyze_ats_compatibility(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze resume for ATS compatibility issues"""
+    async def score_only(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
+        """ATS score of resume content as-is, without applying any optimizations"""
+        self._text_cache.clear()
+        return {"ats_score": self._calculate_ats_score(resume_content)}
+
+    def _analyze_ats_compatibility(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze resume for ATS compatibility issues, reusing analyses of identical content"""
+        content_hash = self._content_hash(resume_content)
+        if content_hash is not None and content_hash in self._analysis_cache:
+            self._analysis_cache.move_to_end(content_hash)
+            cached = self._analysis_cache[content_hash]
+            return {**cached, "issues": list(cached["issues"])}
+
+        analysis = self._compute_ats_analysis(resume_content)
+
+        if content_hash is not None:
+            # Issues are frozen, so a tuple of them keeps the cached analysis immutable
+            self._analysis_cache[content_hash] = {**analysis, "issues": tuple(analysis["issues"])}
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+        return analysis
+
+    def _content_hash(self, resume_content: Dict[str, Any]) -> Optional[str]:
+        """Stable digest of resume content, or None if it cannot be serialized"""
+        try:
+            payload = json.dumps(resume_content, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _compute_ats_analysis(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the full ATS compatibility analysis"""
         issues = []
         score = 100  # Start with perfect score
 
         # Extract text content
         text_content = self._extract_resume_text(resume_content)
 
+        # Nothing to parse, so skip the analyzers entirely
+        if not text_content.strip():
+            return {
+                "score": 0,
+                "issues": [],
+                "section_score": 0,
+                "keyword_score": 0,
+                "format_score": 0,
+            }
+
         # Check for parsing issues
-        for issue_type, issue_config in self.parsing_issues.items():
-            for pattern in issue_config["patterns"]:
-                if re.search(pattern, text_content, re.IGNORECASE):
-                    issues.append(ATSIssue(
-                        rule=ATSRule.FORMAT_COMPATIBILITY,
-                        severity="critical" if issue_type in ["graphics", "tables"] else "warning",
-                        description=f"Found {issue_type} that may confuse ATS parsing",
-                        location="general",
-                        suggestion=issue_config["solution"],
-                    ))
-                    score -= 15 if issue_type in ["graphics", "tables"] else 5
+        for issue_type in self._find_parsing_issues(text_content):
+            issues.append(ATSIssue(
+                rule=ATSRule.FORMAT_COMPATIBILITY,
+                severity="critical" if issue_type in ["graphics", "tables"] else "warning",
+                description=f"Found {issue_type} that may confuse ATS parsing",
+                location="general",
+                suggestion=self.parsing_issues[issue_type]["solution"],
+            ))
+            score -= 15 if issue_type in ["graphics", "tables"] else 5
 
         # Check section structure
-        section_score = await self._analyze_section_structure(resume_content)
+        section_score = self._analyze_section_structure(resume_content)
         score -= (100 - section_score)
 
         # Check keyword optimization
-        keyword_score = await self._analyze_keyword_optimization(text_content)
+        keyword_score = self._analyze_keyword_optimization(text_content)
         score -= (100 - keyword_score)
 
         # Check content formatting
-        format_score = await self._analyze_content_formatting(text_content)
+        format_score = self._analyze_content_formatting(text_content)
         score -= (100 - format_score)
 
         return {
@@ -199,38 +369,60 @@ class ATSOptimizer:
             "format_score": format_score,
         }
 
-    def _extract_resume_text(self, resume_content: Dict[str, Any]) -> str:
-        """Extract all text from resume content"""
-        text_parts = []
+    def _find_parsing_issues(self, text: str) -> List[str]:
+        """Return the parsing issue types present in text, in declaration order"""
+        found = set()
 
-        for section, content in resume_content.items():
-            if isinstance(content, str):
-                text_parts.append(content)
-            elif isinstance(content, list):
-                for item in content:
-                    if isinstance(item, str):
-                        text_parts.append(item)
-                    elif isinstance(item, dict):
-                        text_parts.extend(str(v) for v in item.values() if v)
+        for match in self._issues_re.finditer(text):
+            found.add(match.lastgroup)
+
+            # The alternation reports one type per match, so a type whose match
+            # overlaps this span (e.g. "column") is re-checked inside the span only
+            for issue_type, pattern in self._issue_type_res.items():
+                if issue_type not in found and any(
+                    pattern.match(text, pos) for pos in range(match.start(), match.end())
+                ):
+                    found.add(issue_type)
 
-        return ' '.join(text_parts)
+            if len(found) == len(self._issue_type_res):
+                break
 
-    async def _analyze_section_structure(self, resume_content: Dict[str, Any]) -> float:
+        return [issue_type for issue_type in self._issue_type_res if issue_type in found]
+
+    def _extract_resume_text(self, resume_content: Dict[str, Any]) -> str:
+        """Extract all text from resume content"""
+        cached = self._text_cache.get(id(resume_content))
+        if cached is not None and cached[0] is resume_content:
+            return cached[1]
+
+        text = ' '.join(self._iter_strings(resume_content))
+        self._text_cache[id(resume_content)] = (resume_content, text)
+        return text
+
+    def _iter_strings(self, obj: Any) -> Iterator[str]:
+        """Yield every non-empty string nested in dicts, lists and tuples"""
+        if isinstance(obj, str):
+            if obj:
+                yield obj
+        elif isinstance(obj, dict):
+            for value in obj.values():
+                yield from self._iter_strings(value)
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                yield from self._iter_strings(item)
+
+    def _analyze_section_structure(self, resume_content: Dict[str, Any]) -> float:
         """Analyze section structure for ATS compatibility"""
         score = 100
-        found_sections = set()
+        # Check for standard sections present under their canonical name
+        found_sections = self.section_keywords.keys() & resume_content.keys()
 
-        # Check for standard sections
-        for section_name, keywords in self.section_keywords.items():
-            if section_name in resume_content:
-                found_sections.add(section_name)
-            else:
-                # Check if section exists with different name
-                for content_key in resume_content.keys():
-                    content_text = str(resume_content[content_key]).lower()
-                    if any(keyword in content_text for keyword in keywords):
-                        found_sections.add(section_name)
-                        break
+        # Check if missing sections exist with different names, one pass per section
+        for content in resume_content.values():
+            if len(found_sections) == len(self.section_keywords):
+                break
+            section_text = ' '.join(self._iter_strings(content)).lower()
+            found_sections |= self._match_sections(section_text)
 
         # Score based on found sections
         required_sections = {"contact", "experience", "education", "skills"}
@@ -241,45 +433,72 @@ class ATSOptimizer:
             score -= len(missing) * 10
 
         # Check section ordering (conventional order is better for ATS)
-        conventional_order = ["contact", "summary", "experience", "education", "skills"]
-        section_order = list(resume_content.keys())
-
-        order_score = 0
-        for i, section in enumerate(conventional_order):
-            if section in section_order:
-                order_score += 1
-
-        order_score = (order_score / len(conventional_order)) * 20
+        order_score = len(resume_content.keys() & self._conventional_order)
+        order_score = (order_score / len(self._conventional_order)) * 20
         score += order_score
 
         return max(0, min(100, score))
 
-    async def _analyze_keyword_optimization(self, text_content: str) -> float:
+    def _build_section_matcher(self, section_keywords: Dict[str, List[str]]):
+        """Build a keyword -> section names matcher over all section keywords"""
+        keyword_sections: Dict[str, Tuple[str, ...]] = {}
+        for section_name, keywords in section_keywords.items():
+            for keyword in keywords:
+                keyword_sections[keyword] = keyword_sections.get(keyword, ()) + (section_name,)
+
+        if not AHOCORASICK_AVAILABLE:
+            return keyword_sections
+
+        automaton = ahocorasick.Automaton()
+        for keyword, section_names in keyword_sections.items():
+            automaton.add_word(keyword, section_names)
+        automaton.make_automaton()
+        return automaton
+
+    def _match_sections(self, text: str) -> set:
+        """Return the sections whose keywords occur in text"""
+        if AHOCORASICK_AVAILABLE:
+            return {
+                section_name
+                for _, section_names in self._section_matcher.iter(text)
+                for section_name in section_names
+            }
+
+        return {
+            section_name
+            for keyword, section_names in self._section_matcher.items()
+            if keyword in text
+            for section_name in section_names
+        }
+
+    def _analyze_keyword_optimization(self, text_content: str) -> float:
         """Analyze keyword optimization for ATS"""
         score = 100
 
         # Check for keyword stuffing (too many repetitions)
-        words = re.findall(r'\b\w+\b', text_content.lower())
-        word_counts = {}
-
-        for word in words:
-            if len(word) > 3:  # Only count meaningful words
-                word_counts[word] = word_counts.get(word, 0) + 1
+        words = self._re_word.findall(text_content.lower())
 
-        # Penalize excessive repetition
-        stuffing_penalty = 0
-        for word, count in word_counts.items():
-            if count > 5:  # More than 5 occurrences
-                stuffing_penalty += (count - 5) * 2
+        # Penalize excessive repetition (more than 5 occurrences) of meaningful words
+        if NUMBA_AVAILABLE:
+            hashes = np.fromiter((hash(word) for word in words if len(word) > 3), dtype=np.int64)
+            stuffing_penalty = int(repetition_penalty(hashes))
+        else:
+            word_counts = Counter(word for word in words if len(word) > 3)
+            stuffing_penalty = sum((count - 5) * 2 for count in word_counts.values() if count > 5)
 
         score -= min(stuffing_penalty, 30)
 
         # Check keyword distribution
-        sections = re.split(r'\n\s*\n', text_content)
+        # Plain blank lines are the common separator; only fall back to the
+        # regex for whitespace-only lines or runs of three or more newlines
+        if '\n\n\n' in text_content or self._re_whitespace_blank_line.search(text_content):
+            sections = self._re_section_split.split(text_content)
+        else:
+            sections = text_content.split('\n\n')
         sections_with_keywords = 0
 
         for section in sections:
-            section_words = set(re.findall(r'\b\w+\b', section.lower()))
+            section_words = set(self._re_word.findall(section.lower()))
             # Simple heuristic: sections with diverse vocabulary are better
             if len(section_words) > 10:
                 sections_with_keywords += 1
@@ -289,40 +508,27 @@ class ATSOptimizer:
 
         return max(0, min(100, score))
 
-    async def _analyze_content_formatting(self, text_content: str) -> float:
+    def _analyze_content_formatting(self, text_content: str) -> float:
         """Analyze content formatting for ATS compatibility"""
         score = 100
 
         # Check for problematic characters
-        problematic_chars = ['•', '●', '○', '▪', '▫', '♦', '★', '☆']
-        char_penalty = 0
-
-        for char in problematic_chars:
-            if char in text_content:
-                char_penalty += 5
+        char_penalty = len(self._bad_chars.intersection(text_content)) * 5
 
         score -= min(char_penalty, 25)
 
-        # Check text structure
-        lines = text_content.split('\n')
-        structured_lines = 0
+        # Check text structure (lines starting with bullet or number)
+        structured_lines = len(self._re_structured_line.findall(text_content))
+        nonblank_lines = len(self._re_nonblank_line.findall(text_content))
 
-        for line in lines:
-            line = line.strip()
-            if line:
-                # Check if line looks structured (starts with bullet or number)
-                if re.match(r'^[-\*\•\d]+\.?\s', line):
-                    structured_lines += 1
-
-        structure_score = (structured_lines / len([l for l in lines if l.strip()])) * 15 if lines else 0
+        structure_score = (structured_lines / nonblank_lines) * 15 if nonblank_lines else 0
         score += structure_score
 
         # Check for consistent formatting
-        bullet_patterns = [r'^[-\*\•]', r'^\d+\.', r'^[a-zA-Z]\.']
         bullet_consistency = 0
 
-        for pattern in bullet_patterns:
-            if re.search(pattern, text_content, re.MULTILINE):
+        for pattern in self._re_bullet_styles:
+            if pattern.search(text_content):
                 bullet_consistency += 1
 
         if bullet_consistency > 1:  # Mixed bullet styles
@@ -330,7 +536,7 @@ class ATSOptimizer:
 
         return max(0, min(100, score))
 
-    async def _generate_ats_recommendations(self, analysis: Dict[str, Any]) -> List[ATSRecommendation]:
+    def _generate_ats_recommendations(self, analysis: Dict[str, Any]) -> List[ATSRecommendation]:
         """Generate ATS optimization recommendations"""
         recommendations = []
 
@@ -372,122 +578,83 @@ class ATSOptimizer:
                 expected_impact="Improved text extraction and parsing",
             ))
 
-        # Sort by priority
-        recommendations.sort(key=lambda x: x.priority, reverse=True)
-
-        return recommendations[:10]  # Return top 10
+        # Top 10 by priority
+        return heapq.nlargest(10, recommendations, key=lambda x: x.priority)
 
-    async def _apply_ats_optimizations(
+    def _apply_ats_optimizations(
         self,
         resume_content: Dict[str, Any],
         analysis: Dict[str, Any],
         ats_rules: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Apply ATS optimizations to resume content"""
+        # One shallow copy; every step below rewrites it in place
         optimized_content = resume_content.copy()
 
         # Fix section headers
-        optimized_content = await self._optimize_section_headers(optimized_content)
+        self._optimize_section_headers(optimized_content)
 
         # Clean formatting issues
-        optimized_content = await self._clean_formatting_issues(optimized_content)
+        self._clean_formatting_issues(optimized_content)
 
         # Optimize content structure
-        optimized_content = await self._optimize_content_structure(optimized_content)
+        self._optimize_content_structure(optimized_content)
 
         # Apply custom ATS rules if provided
         if ats_rules:
-            optimized_content = await self._apply_custom_ats_rules(optimized_content, ats_rules)
+            self._apply_custom_ats_rules(optimized_content, ats_rules)
 
         return optimized_content
 
-    async def _optimize_section_headers(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize section headers for ATS parsing"""
-        optimized = resume_content.copy()
-
+    def _optimize_section_headers(self, optimized: Dict[str, Any]) -> Dict[str, Any]:
+        """Optimize section headers for ATS parsing, in place"""
         # Standardize section headers
-        header_mappings = {
-            "work experience": "EXPERIENCE",
-            "professional experience": "EXPERIENCE",
-            "work history": "EXPERIENCE",
-            "employment": "EXPERIENCE",
-            "academic background": "EDUCATION",
-            "educational background": "EDUCATION",
-            "school": "EDUCATION",
-            "technical skills": "SKILLS",
-            "competencies": "SKILLS",
-            "expertise": "SKILLS",
-            "technologies": "SKILLS",
-            "certifications": "CERTIFICATIONS",
-            "credentials": "CERTIFICATIONS",
-            "licenses": "CERTIFICATIONS",
-            "projects": "PROJECTS",
-            "portfolio": "PROJECTS",
-        }
-
         for section_name in list(optimized.keys()):
             section_lower = section_name.lower()
-            if section_lower in header_mappings:
+            if section_lower in self.header_mappings:
                 # Rename section to standard format
-                standard_name = header_mappings[section_lower]
+                standard_name = self.header_mappings[section_lower]
                 if standard_name != section_name:
                     optimized[standard_name] = optimized.pop(section_name)
 
         return optimized
 
-    async def _clean_formatting_issues(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
-        """Clean common formatting issues that confuse ATS"""
-        optimized = {}
-
-        for section_name, section_content in resume_content.items():
+    def _clean_formatting_issues(self, optimized: Dict[str, Any]) -> Dict[str, Any]:
+        """Clean common formatting issues that confuse ATS, in place"""
+        for section_name, section_content in optimized.items():
             if isinstance(section_content, str):
-                cleaned_content = await self._clean_text_formatting(section_content)
-                optimized[section_name] = cleaned_content
+                optimized[section_name] = self._clean_text_formatting(section_content)
             elif isinstance(section_content, list):
                 cleaned_items = []
                 for item in section_content:
                     if isinstance(item, str):
-                        cleaned_items.append(await self._clean_text_formatting(item))
+                        cleaned_items.append(self._clean_text_formatting(item))
                     elif isinstance(item, dict):
                         cleaned_item = {}
                         for key, value in item.items():
                             if isinstance(value, str):
-                                cleaned_item[key] = await self._clean_text_formatting(value)
+                                cleaned_item[key] = self._clean_text_formatting(value)
                             else:
                                 cleaned_item[key] = value
                         cleaned_items.append(cleaned_item)
                     else:
                         cleaned_items.append(item)
                 optimized[section_name] = cleaned_items
-            else:
-                optimized[section_name] = section_content
 
         return optimized
 
-    async def _clean_text_formatting(self, text: str) -> str:
+    def _clean_text_formatting(self, text: str) -> str:
         """Clean text formatting for ATS compatibility"""
-        # Replace fancy bullets with standard ones
-        text = re.sub(r'[•●○▪▫♦★☆]', '•', text)
-
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Clean up line breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Replace fancy bullets and standardize quotes
+        text = text.translate(self._clean_trans)
 
-        # Remove page breaks and special characters
-        text = re.sub(r'\f', '', text)
-
-        # Standardize quotes
-        text = re.sub(r'["""]', '"', text)
-        text = re.sub(r'[''']', "'", text)
+        # Collapse all whitespace, including line breaks and page breaks
+        text = self._re_ws.sub(' ', text)
 
         return text.strip()
 
-    async def _optimize_content_structure(self, resume_content: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize content structure for better ATS parsing"""
-        optimized = resume_content.copy()
-
+    def _optimize_content_structure(self, optimized: Dict[str, Any]) -> Dict[str, Any]:
+        """Optimize content structure for better ATS parsing, in place"""
         # Ensure consistent bullet formatting
         for section_name, section_content in optimized.items():
             if section_name.upper() in ["EXPERIENCE", "SKILLS", "PROJECTS"]:
@@ -496,7 +663,7 @@ class ATSOptimizer:
                     for item in section_content:
                         if isinstance(item, str):
                             # Ensure consistent bullet format
-                            cleaned = re.sub(r'^[-\*\•\d]+\.?\s*', '• ', item.strip())
+                            cleaned = self._re_bullet_prefix.sub('• ', item.strip())
                             optimized_items.append(cleaned)
                         else:
                             optimized_items.append(item)
@@ -504,10 +671,8 @@ class ATSOptimizer:
 
         return optimized
 
-    async def _apply_custom_ats_rules(self, resume_content: Dict[str, Any], ats_rules: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply custom ATS rules"""
-        optimized = resume_content.copy()
-
+    def _apply_custom_ats_rules(self, optimized: Dict[str, Any], ats_rules: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply custom ATS rules, in place"""
         # Apply custom formatting rules
         if ats_rules.get("font_family"):
             # Note: This is informational, actual font changes would need document processing
@@ -516,28 +681,24 @@ class ATSOptimizer:
         if ats_rules.get("remove_tables", False):
             # Remove table-like content
             for section_name, section_content in optimized.items():
-                if isinstance(section_content, str):
-                    # Remove table-like patterns
-                    optimized[section_name] = re.sub(r'\|\s*\|', ' ', section_content)
+                # Remove table-like patterns; nearly all sections have no pipes at all
+                if isinstance(section_content, str) and '|' in section_content:
+                    optimized[section_name] = self._re_table.sub(' ', section_content)
 
         if ats_rules.get("standardize_dates", False):
             # Standardize date formats
             for section_name, section_content in optimized.items():
                 if isinstance(section_content, str):
                     # Convert various date formats to MM/YYYY
-                    optimized[section_name] = re.sub(
-                        r'(\w+)\s+(\d{4})',
-                        lambda m: f"{m.group(2)}",
-                        section_content
-                    )
+                    optimized[section_name] = self._re_date.sub(r'\2', section_content)
 
         return optimized
 
-    async def _calculate_ats_score(self, resume_content: Dict[str, Any]) -> float:
+    def _calculate_ats_score(self, resume_content: Dict[str, Any]) -> float:
         """Calculate ATS compatibility score"""
         try:
             # Re-analyze the optimized content
-            analysis = await self._analyze_ats_compatibility(resume_content)
+            analysis = self._analyze_ats_compatibility(resume_content)
 
             # Weight different factors
             weights = {
@@ -565,11 +726,13 @@ class ATSOptimizer:
     ) -> Dict[str, Any]:
         """Validate resume against specific ATS system requirements"""
         try:
+            self._text_cache.clear()
+
             # Base analysis
-            analysis = await self._analyze_ats_compatibility(resume_content)
+            analysis = self._analyze_ats_compatibility(resume_content)
 
             # ATS-specific validations
-            ats_specific = await self._check_ats_specific_requirements(
+            ats_specific = self._check_ats_specific_requirements(
                 resume_content, ats_system
             )
 
@@ -595,7 +758,7 @@ class ATSOptimizer:
                 "error": str(e),
             }
 
-    async def _check_ats_specific_requirements(
+    def _check_ats_specific_requirements(
         self,
         resume_content: Dict[str, Any],
         ats_system: str,
@@ -604,31 +767,7 @@ class ATSOptimizer:
         score = 100
         recommendations = []
 
-        # Common ATS system requirements
-        requirements = {
-            "workday": {
-                "max_sections": 15,
-                "preferred_format": "docx",
-                "section_headers": ["experience", "education", "skills"],
-            },
-            "taleo": {
-                "max_file_size": 5 * 1024 * 1024,  # 5MB
-                "avoid_tables": True,
-                "simple_formatting": True,
-            },
-            "icims": {
-                "max_sections": 10,
-                "standard_headers": True,
-                "keyword_focus": True,
-            },
-            "greenhouse": {
-                "parsing_focus": True,
-                "section_structure": True,
-                "contact_info": True,
-            },
-        }
-
-        system_reqs = requirements.get(ats_system.lower(), {})
+        system_reqs = self._ATS_REQUIREMENTS.get(ats_system.lower(), {})
 
         if system_reqs.get("max_sections"):
             section_count = len(resume_content)
@@ -641,15 +780,15 @@ class ATSOptimizer:
         if system_reqs.get("avoid_tables"):
             # Check for table-like content
             text_content = self._extract_resume_text(resume_content)
-            if re.search(r'\|\s*\|', text_content):
+            if self._re_table.search(text_content):
                 score -= 15
                 recommendations.append("Remove table formatting")
 
         if system_reqs.get("standard_headers"):
             # Check for standard section headers
-            standard_headers = {"experience", "education", "skills", "summary"}
-            found_headers = set(resume_content.keys())
-            missing_headers = standard_headers - found_headers
+            missing_headers = [
+                header for header in self._STANDARD_HEADERS if header not in resume_content
+            ]
 
             if missing_headers:
                 score -= len(missing_headers) * 5
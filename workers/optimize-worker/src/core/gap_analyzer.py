@@ -3,44 +3,310 @@ Gap Analyzer
 Computes gaps between a resume and a job description (missing must-haves & coverage).
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Executor
+from itertools import islice
+import asyncio
 import re
+import sys
+import json
+import hashlib
+import logging
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    # Ahead-of-time build from build_aot.py; needs numpy but not numba at runtime
+    import numpy as np
+    from .gap_tokenizer import scan_tokens
+    AOT_TOKENIZER_AVAILABLE = True
+except ImportError:
+    AOT_TOKENIZER_AVAILABLE = False
+
+if NUMBA_AVAILABLE and not AOT_TOKENIZER_AVAILABLE:
+    from .gap_kernels import scan_tokens_impl
+    scan_tokens = njit(cache=True, nogil=True)(scan_tokens_impl)
+
+TOKEN_KERNEL_AVAILABLE = AOT_TOKENIZER_AVAILABLE or NUMBA_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_CACHE_SIZE = 4096
+
+# Phrases indicating must-have requirements, fused into one alternation
+MUST_HAVE_MARKERS = [
+    r"must\s+have",
+    r"required",
+    r"minimum\s+of",
+    r"at\s+least",
+    r"strong\s+experience",
+    r"proficiency\s+in",
+]
+# Markers are matched within a line, so their whitespace may not cross a line break
+_MUST_HAVE_RE = re.compile("|".join(MUST_HAVE_MARKERS).replace(r"\s", r"[^\S\n\r]"))
+_SKILL_TOKEN_RE = re.compile(r"[a-z][a-z0-9+.#-]{2,}")
+_REQ_TOKEN_RE = re.compile(r"[a-z0-9+.#-]+")
+# Bytes-mode tokenizer for ASCII views of the text (see _ascii_bytes)
+_SKILL_TOKEN_RE_B = re.compile(rb"[a-z][a-z0-9+.#-]{2,}")
+# Sentences/lines in job descriptions end at any of \n, \r and '.'
+_LINE_BREAKS = bytes.maketrans(b"\r.", b"\n\n")
+
+# Separators ignored when comparing skills (react-native == reactnative)
+_SKILL_SEPARATORS = str.maketrans("", "", ".-")
+
+
+def skill_key(token: str) -> str:
+    """Separator-insensitive form of a skill token"""
+    return token.translate(_SKILL_SEPARATORS)
+
+
+# Common aliases, each set including the requirement itself. Tokens are
+# interned throughout, so set probes mostly resolve on pointer equality.
+_NODE_ALIASES = {"node.js", "node", "nodejs"}
+_ALIASES: Dict[str, frozenset] = {
+    sys.intern(requirement): frozenset(map(sys.intern, aliases))
+    for requirement, aliases in {
+        "javascript": {"javascript", "js", "ecmascript"},
+        "typescript": {"typescript", "ts"},
+        "aws": {"aws", "amazon", "amazonwebservices"},
+        "node.js": _NODE_ALIASES,
+        "nodejs": _NODE_ALIASES,
+        "react": {"react", "reactjs", "react.js"},
+    }.items()
+}
+
+# One bit per alias group: a resume's known aliases fold into a single int
+_ALIAS_GROUPS = list(dict.fromkeys(_ALIASES.values()))
+_REQUIREMENT_BITS: Dict[str, int] = {
+    requirement: 1 << _ALIAS_GROUPS.index(aliases)
+    for requirement, aliases in _ALIASES.items()
+}
+
+
+def _build_alias_token_bits() -> Dict[str, int]:
+    """Map each alias to the bits of every group it belongs to"""
+    token_bits: Dict[str, int] = {}
+    for bit, group in enumerate(_ALIAS_GROUPS):
+        for alias in group:
+            token_bits[alias] = token_bits.get(alias, 0) | (1 << bit)
+    return token_bits
+
+
+_ALIAS_TOKEN_BITS = _build_alias_token_bits()
+
+
+def _build_must_have_db():
+    """Compile the must-have markers into one Hyperscan database, or None"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    try:
+        # Markers must not span line breaks
+        expressions = [
+            marker.replace(r"\s", r"[\t\x0b\x0c\x1c-\x1f ]").encode()
+            for marker in MUST_HAVE_MARKERS
+        ]
+        db = hyperscan.Database()
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions),
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan database compilation failed, using re: {e}")
+        return None
+
+
+_MUST_HAVE_DB = _build_must_have_db()
+
+
+def _doc_starts(texts: List[str]) -> List[int]:
+    """Offsets at which each text starts once the texts are joined with line breaks"""
+    starts = [0]
+    for text in texts[:-1]:
+        starts.append(starts[-1] + len(text) + 1)
+    return starts
+
+
+def _ascii_bytes(text: str) -> bytes:
+    """Bytes of text with each non-ASCII character replaced by '?', keeping offsets"""
+    return text.encode("ascii", "replace")
+
+
+def _ascii_buffer(text: str):
+    """_ascii_bytes as a uint8 array for the tokenizer kernel"""
+    return np.frombuffer(_ascii_bytes(text), dtype=np.uint8)
+
+
+def warmup_numba() -> None:
+    """Compile (or load cached) Numba kernels so the first request does not pay for it"""
+    if NUMBA_AVAILABLE and not AOT_TOKENIZER_AVAILABLE:
+        scan_tokens(_ascii_buffer("python developer"))
+
+
+# Analyzer owned by the current ProcessPoolExecutor worker
+_worker_analyzer: Optional["GapAnalyzer"] = None
+
+
+def init_worker_analyzer() -> None:
+    """ProcessPoolExecutor initializer: build the analyzer and warm its kernels once per worker"""
+    global _worker_analyzer
+    _worker_analyzer = GapAnalyzer()
+    warmup_numba()
+
+
+def analyze_batch_in_worker(
+    pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Analyze a chunk of (resume, job description) pairs inside a worker process"""
+    return _worker_analyzer._compute_batch(pairs)
 
 
 class GapAnalyzer:
     def __init__(self) -> None:
         # Phrases indicating must-have requirements
-        self.must_have_markers = [
-            r"must\s+have",
-            r"required",
-            r"minimum\s+of",
-            r"at\s+least",
-            r"strong\s+experience",
-            r"proficiency\s+in",
-        ]
+        self.must_have_markers = MUST_HAVE_MARKERS
+        # LRU of analyses keyed by (resume digest, job description digest)
+        self._analysis_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
 
     async def analyze(
         self,
         resume_content: Dict[str, Any],
         job_description: Dict[str, Any],
     ) -> Dict[str, Any]:
-        jd_text = self._extract_text(job_description).lower()
-        resume_text = self._extract_text(resume_content).lower()
+        return (await self.analyze_batch([(resume_content, job_description)]))[0]
+
+    async def analyze_batch(
+        self,
+        pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Analyze several (resume, job description) pairs with one tokenizer pass per side"""
+        results, pending, cache_keys = self._lookup_cached(pairs)
+        if pending:
+            computed = self._compute_batch([pairs[i] for i in pending])
+            self._store_computed(results, pending, cache_keys, computed)
+        return results
+
+    async def analyze_many(
+        self,
+        pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        executor: Executor,
+        chunk_size: int = 32,
+    ) -> List[Dict[str, Any]]:
+        """Analyze pairs in chunks across a process pool built with init_worker_analyzer"""
+        results, pending, cache_keys = self._lookup_cached(pairs)
+        if pending:
+            loop = asyncio.get_running_loop()
+            chunks = [
+                [pairs[i] for i in pending[start:start + chunk_size]]
+                for start in range(0, len(pending), chunk_size)
+            ]
+            chunk_results = await asyncio.gather(*(
+                loop.run_in_executor(executor, analyze_batch_in_worker, chunk)
+                for chunk in chunks
+            ))
+            computed = [result for chunk_result in chunk_results for result in chunk_result]
+            self._store_computed(results, pending, cache_keys, computed)
+        return results
+
+    def _lookup_cached(self, pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]]):
+        """Fill cached results; return them with the pending indices and their cache keys"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pairs)
+        pending: List[int] = []
+        cache_keys: List[Optional[Tuple[str, str]]] = []
+
+        for i, (resume_content, job_description) in enumerate(pairs):
+            resume_hash = self._content_hash(resume_content)
+            jd_hash = self._content_hash(job_description)
+            cache_key = (resume_hash, jd_hash) if resume_hash and jd_hash else None
+            if cache_key is not None and cache_key in self._analysis_cache:
+                self._analysis_cache.move_to_end(cache_key)
+                results[i] = dict(self._analysis_cache[cache_key])
+            else:
+                pending.append(i)
+                cache_keys.append(cache_key)
+
+        return results, pending, cache_keys
+
+    def _store_computed(
+        self,
+        results: List[Optional[Dict[str, Any]]],
+        pending: List[int],
+        cache_keys: List[Optional[Tuple[str, str]]],
+        computed: List[Dict[str, Any]],
+    ) -> None:
+        """Cache freshly computed analyses and place copies into results"""
+        for i, cache_key, result in zip(pending, cache_keys, computed):
+            if cache_key is not None:
+                self._analysis_cache[cache_key] = result
+                if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                    self._analysis_cache.popitem(last=False)
+            results[i] = dict(result)
+
+    def _content_hash(self, content: Any) -> Optional[str]:
+        """Stable digest of resume or job content, or None if it cannot be serialized"""
+        try:
+            payload = json.dumps(content, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _compute_batch(
+        self,
+        pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        jd_texts = [self._extract_text(job_description).lower() for _, job_description in pairs]
+        all_must_haves = self._extract_must_haves_batch(jd_texts)
+
+        # Resumes are only tokenized for job descriptions that require something
+        needed = [i for i, must_haves in enumerate(all_must_haves) if must_haves]
+        resumes = [pairs[i][0] for i in needed]
+        all_skills = self._extract_resume_skills_batch(
+            resumes,
+            [self._extract_text(resume_content).lower() for resume_content in resumes],
+        )
+        skills_by_pair = dict(zip(needed, all_skills))
 
-        jd_must_haves = self._extract_must_haves(jd_text)
-        resume_skills = self._extract_resume_skills(resume_content, resume_text)
+        return [
+            self._score_gap(must_haves, skills_by_pair[i]) if must_haves else {
+                "must_haves": [],
+                "present": [],
+                "partial": [],
+                "missing": [],
+                "coverage_score": 1.0,
+                "recommendations": [],
+            }
+            for i, must_haves in enumerate(all_must_haves)
+        ]
+
+    def _score_gap(self, jd_must_haves: List[str], resume_skills: Set[str]) -> Dict[str, Any]:
+        alias_bits = self._alias_bits(resume_skills)
 
         present: List[str] = []
         missing: List[str] = []
         partial: List[str] = []
 
         for req in jd_must_haves:
-            if self._match_exact_or_alias(req, resume_skills):
+            if self._match_exact_or_alias(req, resume_skills, alias_bits):
                 present.append(req)
             else:
                 # partial match if any token overlaps
-                req_tokens = set(re.findall(r"[a-z0-9+.#-]+", req))
-                if req_tokens & resume_skills:
+                if not resume_skills.isdisjoint(_REQ_TOKEN_RE.findall(req)):
                     partial.append(req)
                 else:
                     missing.append(req)
@@ -68,67 +334,119 @@ class GapAnalyzer:
         }
 
     def _extract_text(self, content: Any) -> str:
+        """Join every non-empty string nested in dicts, lists and tuples, in document order"""
         if isinstance(content, str):
             return content
-        if isinstance(content, list):
-            parts: List[str] = []
-            for item in content:
-                if isinstance(item, str):
+
+        parts: List[str] = []
+        stack = [content]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                if item:
                     parts.append(item)
-                elif isinstance(item, dict):
-                    parts.extend(str(v) for v in item.values() if v)
-            return " ".join(parts)
-        if isinstance(content, dict):
-            return " ".join(str(v) for v in content.values() if v)
-        return str(content)
+            elif isinstance(item, dict):
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, (list, tuple)):
+                stack.extend(reversed(item))
+        return " ".join(parts)
 
     def _extract_must_haves(self, jd_text: str) -> List[str]:
-        # Collect sentences/lines that contain must-have markers
-        candidates: List[str] = []
-        lines = re.split(r"[\n\r.]+", jd_text)
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if any(re.search(marker, line) for marker in self.must_have_markers):
-                candidates.append(line)
-
-        # Extract noun-phrases-like tokens (simple heuristic)
-        reqs: Set[str] = set()
-        for c in candidates:
-            # Find tech/tool/skill-like tokens
-            tokens = re.findall(r"[a-z][a-z0-9+.#-]{2,}", c)
-            # Keep top 1-3 salient tokens per sentence
-            for t in tokens[:3]:
-                reqs.add(t)
-        # Return sorted for consistency
-        return sorted(reqs)
+        return self._extract_must_haves_batch([jd_text])[0]
+
+    def _extract_must_haves_batch(self, jd_texts: List[str]) -> List[List[str]]:
+        """Must-haves of each job description, from one pass over their concatenation"""
+        # Joining on a line break keeps every line, token and marker inside one text
+        joined = "\n".join(jd_texts)
+        doc_starts = _doc_starts(jd_texts)
+
+        buf = _ascii_bytes(joined)
+        lined = buf.translate(_LINE_BREAKS)
+
+        # Keep the first 1-3 tech/tool/skill-like tokens of each must-have line
+        reqs: List[Dict[str, None]] = [{} for _ in jd_texts]
+        for start, end in self._must_have_line_spans(joined, lined):
+            doc_reqs = reqs[bisect_right(doc_starts, start) - 1]
+            for m in islice(_SKILL_TOKEN_RE_B.finditer(buf, start, end), 3):
+                doc_reqs[sys.intern(m.group().decode())] = None
+        # Deduplicated in order of first appearance, which is deterministic
+        return [list(doc_reqs) for doc_reqs in reqs]
+
+    def _must_have_line_spans(self, jd_text: str, lined: bytes) -> List[Tuple[int, int]]:
+        """(start, end) offsets of the lines containing a must-have marker, in order
+
+        lined is the ASCII view of jd_text with every line separator mapped to a
+        newline, so only lines holding a marker are ever bounded or tokenized.
+        """
+        if _MUST_HAVE_DB is None:
+            marker_ends = [m.end() for m in _MUST_HAVE_RE.finditer(jd_text)]
+        else:
+            marker_ends = []
+
+            def on_match(pattern_id, start, end, flags, context):
+                marker_ends.append(end)
+
+            _MUST_HAVE_DB.scan(lined, match_event_handler=on_match)
+            marker_ends.sort()
+
+        spans: List[Tuple[int, int]] = []
+        line_end = -1
+        for marker_end in marker_ends:
+            if marker_end <= line_end:
+                continue  # another marker on the line already taken
+            line_start = lined.rfind(b"\n", 0, marker_end) + 1
+            line_end = lined.find(b"\n", marker_end)
+            if line_end < 0:
+                line_end = len(lined)
+            spans.append((line_start, line_end))
+        return spans
 
     def _extract_resume_skills(self, resume: Dict[str, Any], resume_text: str) -> Set[str]:
-        skills: Set[str] = set()
-        if isinstance(resume.get("skills"), list):
-            for s in resume.get("skills", []):
-                if isinstance(s, str):
-                    for tok in re.findall(r"[a-z][a-z0-9+.#-]{2,}", s.lower()):
-                        skills.add(tok)
-        # Also extract from full text as fallback
-        for tok in re.findall(r"[a-z][a-z0-9+.#-]{2,}", resume_text):
-            skills.add(tok)
-        return skills
-
-    def _match_exact_or_alias(self, requirement: str, skills: Set[str]) -> bool:
-        # Simple normalization & common aliases
-        aliases = {requirement}
-        if requirement == "javascript":
-            aliases |= {"js", "ecmascript"}
-        if requirement == "typescript":
-            aliases |= {"ts"}
-        if requirement == "aws":
-            aliases |= {"amazon", "amazonwebservices"}
-        if requirement == "node.js" or requirement == "nodejs":
-            aliases |= {"node", "nodejs", "node.js"}
-        if requirement == "react":
-            aliases |= {"reactjs", "react.js"}
-        return any(a in skills for a in aliases)
+        return self._extract_resume_skills_batch([resume], [resume_text])[0]
+
+    def _extract_resume_skills_batch(
+        self,
+        resumes: List[Dict[str, Any]],
+        resume_texts: List[str],
+    ) -> List[Set[str]]:
+        """Skill tokens of each resume, scanning the concatenated texts once"""
+        all_skills: List[Set[str]] = []
+        for resume in resumes:
+            skills: Set[str] = set()
+            if isinstance(resume.get("skills"), list):
+                for s in resume.get("skills", []):
+                    if isinstance(s, str):
+                        skills.update(map(sys.intern, _SKILL_TOKEN_RE.findall(s.lower())))
+            all_skills.append(skills)
+
+        # Also extract from full text as fallback; no token spans a line break
+        joined = "\n".join(resume_texts)
+        doc_starts = _doc_starts(resume_texts)
+        if TOKEN_KERNEL_AVAILABLE:
+            spans = scan_tokens(_ascii_buffer(joined))
+            doc_ids = np.searchsorted(np.asarray(doc_starts), spans[:, 0], side="right") - 1
+            for (start, end), doc_id in zip(spans.tolist(), doc_ids.tolist()):
+                all_skills[doc_id].add(sys.intern(joined[start:end]))
+        else:
+            for m in _SKILL_TOKEN_RE_B.finditer(_ascii_bytes(joined)):
+                all_skills[bisect_right(doc_starts, m.start()) - 1].add(sys.intern(m.group().decode()))
+
+        # Index separator-free variants too, so spelling variants still match
+        for skills in all_skills:
+            skills.update([sys.intern(skill_key(tok)) for tok in skills])
+        return all_skills
+
+    def _alias_bits(self, skills: Set[str]) -> int:
+        """Bitmask of the alias groups with at least one member among skills"""
+        bits = 0
+        for alias in skills.intersection(_ALIAS_TOKEN_BITS):
+            bits |= _ALIAS_TOKEN_BITS[alias]
+        return bits
+
+    def _match_exact_or_alias(self, requirement: str, skills: Set[str], alias_bits: int) -> bool:
+        bit = _REQUIREMENT_BITS.get(requirement)
+        if bit is None:
+            return requirement in skills or skill_key(requirement) in skills
+        return bool(alias_bits & bit)
 
 
@@ -0,0 +1,35 @@
+"""
+Gap Kernels
+Token-scanning kernels shared by the JIT (numba.njit) and AOT (build_aot.py) builds of the gap analyzer tokenizer.
+"""
+
+import numpy as np
+
+
+def scan_tokens_impl(buf):
+    """(start, end) offsets of [a-z][a-z0-9+.#-]{2,} tokens in an ASCII byte array
+
+    Same leftmost-greedy result as the regex: within each run of token
+    characters, the token starts at the first letter and ends with the run.
+    """
+    n = buf.size
+    spans = np.empty((n // 4 + 1, 2), np.int64)
+    count = 0
+    i = 0
+    while i < n:
+        first = -1
+        j = i
+        while j < n:
+            c = buf[j]
+            if 97 <= c <= 122:  # a-z
+                if first < 0:
+                    first = j
+            elif not (48 <= c <= 57 or c == 43 or c == 35 or c == 45 or c == 46):
+                break
+            j += 1
+        if first >= 0 and j - first >= 3:
+            spans[count, 0] = first
+            spans[count, 1] = j
+            count += 1
+        i = j + 1
+    return spans[:count]
@@ -3,8 +3,12 @@ Resume Optimizer
 Main orchestrator for comprehensive resume optimization using STAR bullets, keyword infusion, ATS optimization, and section ordering.
 """
 
+import re
+import json
 import asyncio
+import hashlib
 import logging
+from collections import Counter, OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,6 +20,13 @@ from .section_optimizer import SectionOptimizer
 
 logger = logging.getLogger(__name__)
 
+# Capitalized terms of four or more characters, e.g. "Python", "Node.js", "CI-CD"
+_CAP_TOKEN_RE = re.compile(r"\b[A-Z][A-Za-z0-9+#.\-]{3,}\b")
+_WS_RE = re.compile(r"\S+")
+
+JD_FEATURE_CACHE_SIZE = 256
+BENCHMARK_CONCURRENCY = 4
+
 @dataclass
 class OptimizationResult:
     """Result of resume optimization"""
@@ -60,6 +71,13 @@ class ResumeOptimizer:
             "content_quality": 0.2,
         }
 
+        # (job requirements, target keywords) keyed by job description digest;
+        # the least recently used entry is evicted past JD_FEATURE_CACHE_SIZE
+        self._jd_cache: "OrderedDict[str, Tuple[List[str], List[str]]]" = OrderedDict()
+
+        # Bounds concurrent benchmark runs so downstream model APIs are not saturated
+        self._bench_sem = asyncio.Semaphore(BENCHMARK_CONCURRENCY)
+
     async def optimize_resume(
         self,
         resume_id: str,
@@ -104,12 +122,12 @@ class ResumeOptimizer:
             job_requirements = None
             target_keywords = []
             if job_description:
-                job_requirements = await self._extract_job_requirements(job_description)
-                target_keywords = await self._extract_target_keywords(job_description)
+                job_requirements, target_keywords = await self._get_jd_features(job_description)
 
             # Apply optimization based on type
+            stage_scores = None
             if optimization_type == "comprehensive":
-                optimized_content = await self._comprehensive_optimization(
+                optimized_content, stage_scores = await self._comprehensive_optimization(
                     resume_content, job_requirements, target_keywords, config
                 )
             elif optimization_type == "star":
@@ -131,7 +149,7 @@ class ResumeOptimizer:
 
             # Calculate final scores
             final_scores = await self._calculate_final_scores(
-                optimized_content, job_requirements, target_keywords
+                optimized_content, job_requirements, target_keywords, stage_scores
             )
 
             # Generate improvement summary
@@ -188,13 +206,14 @@ class ResumeOptimizer:
         job_requirements: Optional[List[str]],
         target_keywords: List[str],
         config: OptimizationConfig,
-    ) -> Dict[str, Any]:
-        """Apply comprehensive optimization combining all techniques"""
-        optimized = resume_content.copy()
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Apply comprehensive optimization combining all techniques, returning the stage scores too"""
+        # Stages never mutate their input; each replaces only the sections it
+        # changes in a new top-level dict, so unchanged sections are shared
 
         # Step 1: Optimize section order
         section_result = await self.section_optimizer.optimize_section_order(
-            optimized, config.industry, config.job_level
+            resume_content, config.industry, config.job_level
         )
         optimized = section_result["optimized_content"]
 
@@ -206,7 +225,8 @@ class ResumeOptimizer:
                 tone=config.tone,
             )
             if star_result["star_bullets"]:
-                optimized["experience"] = star_result["star_bullets"]
+                # Copy on write: the section stage may hand back resume_content itself
+                optimized = {**optimized, "experience": star_result["star_bullets"]}
 
         # Step 3: Optimize keywords throughout the resume
         keyword_result = await self.keyword_optimizer.optimize_keywords(
@@ -218,7 +238,13 @@ class ResumeOptimizer:
         ats_result = await self.ats_optimizer.optimize_for_ats(optimized)
         optimized = ats_result["optimized_content"]
 
-        return optimized
+        # Scores the stages already measured, so final scoring need not rerun them
+        stage_scores = {"ats_score": ats_result.get("ats_score", 0.0)}
+        if target_keywords:
+            stage_scores["keyword_density"] = keyword_result.get("keyword_density", 0.0)
+            stage_scores["naturalness_score"] = keyword_result.get("naturalness_score", 0.0)
+
+        return optimized, stage_scores
 
     async def _star_optimization(
         self,
@@ -227,24 +253,23 @@ class ResumeOptimizer:
         tone: str,
     ) -> Dict[str, Any]:
         """Optimize resume with STAR bullet points"""
-        optimized = resume_content.copy()
+        optimized = resume_content
 
-        # Focus on experience section
+        # Focus on experience section; copied on write so unchanged resumes are shared
         if "experience" in optimized:
             if isinstance(optimized["experience"], list):
-                # Multiple experience items
+                # Multiple experience items, generated in one batch
+                star_results = await self.star_generator.generate_star_bullets_batch(
+                    optimized["experience"], job_requirements, tone
+                )
+
                 optimized_experience = []
-                for item in optimized["experience"]:
-                    star_result = await self.star_generator.generate_star_bullets(
-                        experience_item=item,
-                        job_requirements=job_requirements,
-                        tone=tone,
-                    )
+                for item, star_result in zip(optimized["experience"], star_results):
                     if star_result["star_bullets"]:
                         optimized_experience.extend(star_result["star_bullets"])
                     else:
                         optimized_experience.append(item)
-                optimized["experience"] = optimized_experience
+                optimized = {**optimized, "experience": optimized_experience}
             else:
                 # Single experience block
                 star_result = await self.star_generator.generate_star_bullets(
@@ -253,7 +278,7 @@ class ResumeOptimizer:
                     tone=tone,
                 )
                 if star_result["star_bullets"]:
-                    optimized["experience"] = star_result["star_bullets"]
+                    optimized = {**optimized, "experience": star_result["star_bullets"]}
 
         return optimized
 
@@ -289,6 +314,34 @@ class ResumeOptimizer:
         )
         return section_result["optimized_content"]
 
+    def _jd_key(self, job_description: Dict[str, Any]) -> Optional[str]:
+        """Stable digest of a job description, or None if it cannot be serialized"""
+        try:
+            payload = json.dumps(job_description, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    async def _get_jd_features(self, job_description: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """Job requirements and target keywords, reused across calls with the same job description"""
+        cache_key = self._jd_key(job_description)
+        if cache_key is not None and cache_key in self._jd_cache:
+            self._jd_cache.move_to_end(cache_key)
+            job_requirements, target_keywords = self._jd_cache[cache_key]
+            return list(job_requirements), list(target_keywords)
+
+        job_requirements, target_keywords = await asyncio.gather(
+            self._extract_job_requirements(job_description),
+            self._extract_target_keywords(job_description),
+        )
+
+        if cache_key is not None:
+            self._jd_cache[cache_key] = (list(job_requirements), list(target_keywords))
+            if len(self._jd_cache) > JD_FEATURE_CACHE_SIZE:
+                self._jd_cache.popitem(last=False)
+
+        return job_requirements, target_keywords
+
     async def _extract_job_requirements(self, job_description: Dict[str, Any]) -> List[str]:
         """Extract key requirements from job description"""
         requirements = []
@@ -306,36 +359,28 @@ class ResumeOptimizer:
 
     async def _extract_target_keywords(self, job_description: Dict[str, Any]) -> List[str]:
         """Extract target keywords from job description"""
-        keywords = []
-
         # Simple keyword extraction - in production, this would be more sophisticated
-        text_content = ""
+        parts = []
         for content in job_description.values():
             if isinstance(content, str):
-                text_content += content + " "
+                parts.append(content)
             elif isinstance(content, list):
-                text_content += " ".join(str(item) for item in content) + " "
-
-        # Extract potential keywords (words appearing multiple times or with capital letters)
-        words = text_content.split()
-        word_counts = {}
+                parts.extend(map(str, content))
 
-        for word in words:
-            if len(word) > 3 and word[0].isupper():
-                word_counts[word] = word_counts.get(word, 0) + 1
+        # Count capitalized terms in one pass over the joined text
+        word_counts = Counter(_CAP_TOKEN_RE.findall(" ".join(parts)))
 
-        # Return keywords that appear at least twice
-        keywords = [word for word, count in word_counts.items() if count >= 2]
-
-        return keywords[:20]  # Limit to top 20 keywords
+        # Return the top 20 keywords that appear at least twice
+        return [word for word, count in word_counts.most_common(20) if count >= 2]
 
     async def _calculate_final_scores(
         self,
         optimized_content: Dict[str, Any],
         job_requirements: Optional[List[str]],
         target_keywords: List[str],
+        precomputed: Optional[Dict[str, float]] = None,
     ) -> Dict[str, float]:
-        """Calculate final optimization scores"""
+        """Calculate final optimization scores, taking any precomputed stage scores as given"""
         scores = {
             "ats_score": 0.0,
             "keyword_score": 0.0,
@@ -344,16 +389,24 @@ class ResumeOptimizer:
             "overall_score": 0.0,
         }
 
+        precomputed = precomputed or {}
+
         try:
             # Calculate ATS score
-            ats_result = await self.ats_optimizer.optimize_for_ats(optimized_content)
-            scores["ats_score"] = ats_result.get("ats_score", 0.0)
+            if "ats_score" in precomputed:
+                scores["ats_score"] = precomputed["ats_score"]
+            else:
+                ats_result = await self.ats_optimizer.score_only(optimized_content)
+                scores["ats_score"] = ats_result.get("ats_score", 0.0)
 
             # Calculate keyword score
             if target_keywords:
-                keyword_result = await self.keyword_optimizer.optimize_keywords(
-                    optimized_content, target_keywords
-                )
+                if "keyword_density" in precomputed:
+                    keyword_result = precomputed
+                else:
+                    keyword_result = await self.keyword_optimizer.score_only(
+                        optimized_content, target_keywords
+                    )
                 scores["keyword_score"] = (
                     keyword_result.get("keyword_density", 0.0) * 100 +
                     keyword_result.get("naturalness_score", 0.0)
@@ -366,7 +419,7 @@ class ResumeOptimizer:
             scores["structure_score"] = structure_result.get("structure_score", 0.0)
 
             # Calculate content quality score (simplified)
-            total_words = sum(len(str(content).split()) for content in optimized_content.values())
+            total_words = sum(self._count_words(content) for content in optimized_content.values())
             scores["content_quality_score"] = min(100.0, total_words / 2)
 
             # Calculate overall score
@@ -382,6 +435,20 @@ class ResumeOptimizer:
 
         return scores
 
+    def _count_words(self, content: Any) -> int:
+        """Count words in every string nested in a section, without serializing it"""
+        total_words = 0
+        stack = [content]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                total_words += sum(1 for _ in _WS_RE.finditer(item))
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+        return total_words
+
     async def _generate_improvements_summary(
         self,
         original_content: Dict[str, Any],
@@ -400,11 +467,16 @@ class ResumeOptimizer:
 
         # Check for STAR bullet improvements
         if optimization_type in ["comprehensive", "star"]:
-            original_exp_words = len(str(original_content.get("experience", "")).split())
-            optimized_exp_words = len(str(optimized_content.get("experience", "")).split())
+            original_exp = original_content.get("experience", "")
+            optimized_exp = optimized_content.get("experience", "")
 
-            if optimized_exp_words != original_exp_words:
-                improvements.append("Converted experience descriptions to STAR format bullets")
+            # Only tokenize when the experience section actually changed
+            if optimized_exp is not original_exp and optimized_exp != original_exp:
+                original_exp_words = sum(1 for _ in _WS_RE.finditer(str(original_exp)))
+                optimized_exp_words = sum(1 for _ in _WS_RE.finditer(str(optimized_exp)))
+
+                if optimized_exp_words != original_exp_words:
+                    improvements.append("Converted experience descriptions to STAR format bullets")
 
         # Check for keyword improvements
         if optimization_type in ["comprehensive", "keywords"]:
@@ -415,10 +487,7 @@ class ResumeOptimizer:
             improvements.append("Optimized formatting for ATS compatibility")
 
         # Section ordering improvements
-        original_order = list(original_content.keys())
-        optimized_order = list(optimized_content.keys())
-
-        if original_order != optimized_order:
+        if tuple(original_content) != tuple(optimized_content):
             improvements.append("Reordered sections for optimal impact")
 
         if not improvements:
@@ -437,8 +506,7 @@ class ResumeOptimizer:
             job_requirements = None
             target_keywords = []
             if job_description:
-                job_requirements = await self._extract_job_requirements(job_description)
-                target_keywords = await self._extract_target_keywords(job_description)
+                job_requirements, target_keywords = await self._get_jd_features(job_description)
 
             # Calculate quality scores
             scores = await self._calculate_final_scores(
@@ -540,17 +608,27 @@ class ResumeOptimizer:
             logger.info("Starting optimization benchmarking")
 
             benchmark_results = {}
-            base_resume = resume_content.copy()
-
-            for opt_type in optimization_types:
-                # Apply optimization
-                result = await self.optimize_resume(
-                    resume_id="benchmark",
-                    resume_content=base_resume.copy(),
-                    job_description=job_description,
-                    optimization_type=opt_type,
-                )
 
+            # Extract job description features once; every run then hits the cache
+            if job_description:
+                await self._get_jd_features(job_description)
+
+            # Optimizations never mutate their input, so every run shares resume_content
+            async def run_optimization(opt_type: str) -> Tuple[str, Dict[str, Any]]:
+                async with self._bench_sem:
+                    return opt_type, await self.optimize_resume(
+                        resume_id="benchmark",
+                        resume_content=resume_content,
+                        job_description=job_description,
+                        optimization_type=opt_type,
+                    )
+
+            # Runs are independent, so apply every optimization concurrently
+            runs = await asyncio.gather(*(
+                run_optimization(opt_type) for opt_type in optimization_types
+            ))
+
+            for opt_type, result in runs:
                 # Calculate improvement metrics
                 improvement = {
                     "optimization_type": opt_type,
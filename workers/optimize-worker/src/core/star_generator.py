@@ -5,7 +5,7 @@ Generates STAR (Situation, Task, Action, Result) format bullet points from resum
 
 import re
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Set
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
@@ -106,6 +106,40 @@ class STARGenerator:
         Returns:
             Dictionary with STAR bullets and metadata
         """
+        return await self._generate_star_result(
+            experience_item, job_requirements, tone, max_bullets
+        )
+
+    async def generate_star_bullets_batch(
+        self,
+        experience_items: List[Dict[str, Any]],
+        job_requirements: Optional[List[str]] = None,
+        tone: str = "achievement",
+        max_bullets: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """Generate STAR bullets for several experience items, in order, sharing the job requirement terms"""
+        job_words = None
+        if job_requirements:
+            try:
+                job_words = self._job_terms(job_requirements)
+            except Exception:
+                # Left to each item, which reports the failure as generate_star_bullets would
+                job_words = None
+
+        return list(await asyncio.gather(*(
+            self._generate_star_result(item, job_requirements, tone, max_bullets, job_words)
+            for item in experience_items
+        )))
+
+    async def _generate_star_result(
+        self,
+        experience_item: Dict[str, Any],
+        job_requirements: Optional[List[str]],
+        tone: str,
+        max_bullets: int,
+        job_words: Optional[Set[str]] = None,
+    ) -> Dict[str, Any]:
+        """Generate STAR bullets for one item, given the job requirement terms if already extracted"""
         try:
             tone_enum = Tone(tone.lower())
 
@@ -134,7 +168,7 @@ class STARGenerator:
                     bullets.append(bullet)
 
             # Calculate keyword infusion
-            keyword_infused = await self._check_keyword_infused(bullets, job_requirements)
+            keyword_infused = await self._check_keyword_infused(bullets, job_requirements, job_words)
 
             # Calculate impact score
             impact_score = await self._calculate_impact_score(bullets)
@@ -305,17 +339,26 @@ class STARGenerator:
         }
         return verb_map.get(verb.lower(), verb)
 
-    async def _check_keyword_infused(self, bullets: List[str], job_requirements: Optional[List[str]]) -> bool:
+    def _job_terms(self, job_requirements: List[str]) -> Set[str]:
+        """Key terms of the job requirements: words longer than three characters"""
+        job_text = " ".join(job_requirements).lower()
+        return {word for word in re.findall(r'\b\w+\b', job_text) if len(word) > 3}
+
+    async def _check_keyword_infused(
+        self,
+        bullets: List[str],
+        job_requirements: Optional[List[str]],
+        job_words: Optional[Set[str]] = None,
+    ) -> bool:
         """Check if job requirements keywords are infused in bullets"""
         if not job_requirements or not bullets:
             return False
 
         bullet_text = " ".join(bullets).lower()
-        job_text = " ".join(job_requirements).lower()
 
         # Extract key terms from job requirements
-        job_words = set(re.findall(r'\b\w+\b', job_text))
-        job_words = {word for word in job_words if len(word) > 3}  # Filter short words
+        if job_words is None:
+            job_words = self._job_terms(job_requirements)
 
         # Check coverage in bullets
         bullet_words = set(re.findall(r'\b\w+\b', bullet_text))
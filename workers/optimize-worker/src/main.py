@@ -7,6 +7,7 @@ import asyncio
 import logging
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 import json
@@ -18,12 +19,12 @@ import uvicorn
 import structlog
 
 from .core.star_generator import STARGenerator
-from .core.keyword_optimizer import KeywordOptimizer
+from .core.keyword_optimizer import KeywordOptimizer, init_worker_optimizer
 from .core.ats_optimizer import ATSOptimizer
 from .core.section_optimizer import SectionOptimizer
 from .core.resume_optimizer import ResumeOptimizer
 from .queue.task_queue import TaskQueue
-from .core.gap_analyzer import GapAnalyzer
+from .core.gap_analyzer import GapAnalyzer, warmup_numba
 from .database.connection import DatabaseManager
 
 # Configure structured logging
@@ -148,8 +149,16 @@ async def lifespan(app: FastAPI):
         db_manager = DatabaseManager()
         await db_manager.connect()
 
+        # Infuse keywords into resume sections in worker processes;
+        # cores are shared between the uvicorn workers
+        web_concurrency = int(os.getenv("WEB_CONCURRENCY", "1"))
+        app.state.pool = ProcessPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 1) // web_concurrency),
+            initializer=init_worker_optimizer,
+        )
+
         star_generator = STARGenerator()
-        keyword_optimizer = KeywordOptimizer()
+        keyword_optimizer = KeywordOptimizer(executor=app.state.pool)
         ats_optimizer = ATSOptimizer()
         section_optimizer = SectionOptimizer()
         resume_optimizer = ResumeOptimizer(
@@ -159,6 +168,8 @@ async def lifespan(app: FastAPI):
             section_optimizer=section_optimizer,
         )
         gap_analyzer = GapAnalyzer()
+        # Compile the gap tokenizer off the event loop before serving requests
+        await asyncio.to_thread(warmup_numba)
 
         task_queue = TaskQueue()
         await task_queue.connect()
@@ -172,6 +183,8 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         # Cleanup
+        if getattr(app.state, "pool", None):
+            app.state.pool.shutdown(wait=True, cancel_futures=True)
         if task_queue:
             await task_queue.disconnect()
         if db_manager:
@@ -448,14 +461,11 @@ async def generate_star_batch(
     try:
         logger.info("Starting batch STAR generation", resume_id=resume_id, count=len(experience_items))
 
-        results = []
-        for item in experience_items:
-            result = await star_generator.generate_star_bullets(
-                experience_item=item,
-                job_requirements=job_requirements,
-                tone=tone,
-            )
-            results.append(result)
+        results = await star_generator.generate_star_bullets_batch(
+            experience_items,
+            job_requirements=job_requirements,
+            tone=tone,
+        )
 
         logger.info("Batch STAR generation completed", resume_id=resume_id)
         return {
@@ -0,0 +1,17 @@
+"""
+Shared fixtures for Optimize Worker tests
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ats_optimizer():
+    from src.core.ats_optimizer import ATSOptimizer
+    return ATSOptimizer()
+
+
+@pytest.fixture(scope="session")
+def keyword_optimizer():
+    from src.core.keyword_optimizer import KeywordOptimizer
+    return KeywordOptimizer()
@@ -0,0 +1,42 @@
+"""
+Tests for ATS keyword analysis
+"""
+
+import pytest
+
+
+class TestKeywordOptimization:
+    """Test keyword optimization analysis"""
+
+    @pytest.fixture
+    def optimizer(self, ats_optimizer):
+        return ats_optimizer
+
+    @pytest.mark.parametrize("separator", ["\n\n", "\n \n", "\n\t\n", "\n\n\n", "\n \t \n"])
+    def test_mixed_blank_line_styles(self, optimizer, separator):
+        """Whitespace-only blank lines separate sections just like plain ones"""
+        diverse = "developer building cloud services with kubernetes terraform ansible grafana kafka spark daily"
+        # Ten repetitions cost a stuffing penalty of 10, so the distribution bonus is not capped away
+        stuffed = " ".join(["python"] * 10)
+        text = f"{diverse}\n\n{stuffed}{separator}short"
+
+        # Three sections, one with diverse vocabulary
+        assert optimizer._analyze_keyword_optimization(text) == pytest.approx(90 + 20 / 3)
+
+
+class TestAnalysisCache:
+    """Test reuse of ATS analyses for identical content"""
+
+    def test_cached_issues_are_not_shared(self, ats_optimizer):
+        """Mutating a returned analysis leaves later lookups untouched"""
+        resume = {"summary": "Engineer who built a company logo and a sidebar table"}
+
+        first = ats_optimizer._analyze_ats_compatibility(resume)
+        expected = list(first["issues"])
+        assert expected
+        first["issues"].clear()
+
+        second = ats_optimizer._analyze_ats_compatibility(resume)
+        assert second["issues"] == expected
+        second["issues"].append("extra")
+        assert ats_optimizer._analyze_ats_compatibility(resume)["issues"] == expected
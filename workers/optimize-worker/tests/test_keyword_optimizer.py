@@ -0,0 +1,32 @@
+"""
+Tests for keyword infusion
+"""
+
+import asyncio
+
+import pytest
+
+
+class TestKeywordInfusion:
+    """Test whole-word keyword handling during infusion"""
+
+    @pytest.fixture
+    def optimizer(self, keyword_optimizer):
+        return keyword_optimizer
+
+    @pytest.mark.parametrize("language", ["JavaScript", "Python"])
+    def test_keyword_inside_longer_word_is_infused(self, optimizer, language):
+        """A keyword only found inside a longer word ("java" in "javascript") is still infused"""
+        resume = {
+            "summary": (
+                f"Led and managed teams, developed and designed services, implemented {language} "
+                "tooling, improved and increased reliability, reduced costs, created dashboards "
+                "and achieved goals for clients"
+            ),
+        }
+
+        result = asyncio.run(optimizer.optimize_keywords(resume, ["Java"]))
+
+        assert result["keywords_added"] == ["Java"]
+        assert result["keyword_density"] > 0
+        assert " Java " in result["optimized_content"]["summary"]